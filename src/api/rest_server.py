@@ -220,7 +220,7 @@ class RestServer:
                         return APIResponse(success=True, message="Configuration retrieved", data={key: value})
                     else:
                         # Return all configuration
-                        return APIResponse(success=True, message="All configuration retrieved", data=self.config_manager.config)
+                        return APIResponse(success=True, message="All configuration retrieved", data=self.config_manager.get_config_tree())
                 except Exception as e:
                     raise HTTPException(status_code=500, detail=str(e))
             
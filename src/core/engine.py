@@ -78,6 +78,9 @@ class AntiRecoilEngine:
         self.engine_thread: Optional[threading.Thread] = None
         self.running = False
         
+        # Called whenever state shown in the GUI changes; may run on the engine thread
+        self.status_callbacks: tuple = ()
+        
         self.logger.info("Anti-recoil engine initialized")
     
     async def start(self) -> bool:
@@ -97,6 +100,7 @@ class AntiRecoilEngine:
             self.engine_thread.start()
             
             self.state = RecoilState.ACTIVE
+            self.notify_status_change()
             self.logger.info("Anti-recoil engine started successfully")
             return True
             
@@ -111,6 +115,7 @@ class AntiRecoilEngine:
             
             self.running = False
             self.state = RecoilState.INACTIVE
+            self.notify_status_change()
             
             # Stop components
             await self.input_handler.cleanup()
@@ -196,6 +201,8 @@ class AntiRecoilEngine:
             latency = (time.perf_counter() - start_time) * 1000  # Convert to ms
             self._update_latency_metrics(latency)
             
+            self.notify_status_change()
+            
         except Exception as e:
             self.logger.error(f"Error handling shot fired: {e}")
     
@@ -293,6 +300,7 @@ class AntiRecoilEngine:
             # Load weapon pattern from database/config
             self.current_weapon = weapon_name
             self.current_pattern = self._load_weapon_pattern(weapon_name, game)
+            self.notify_status_change()
             self.logger.info(f"Set weapon: {weapon_name} for game: {game}")
             return True
         except Exception as e:
@@ -308,13 +316,33 @@ class AntiRecoilEngine:
     def pause(self) -> None:
         """Pause the anti-recoil engine."""
         self.state = RecoilState.PAUSED
+        self.notify_status_change()
         self.logger.info("Anti-recoil engine paused")
     
     def resume(self) -> None:
         """Resume the anti-recoil engine."""
         self.state = RecoilState.ACTIVE
+        self.notify_status_change()
         self.logger.info("Anti-recoil engine resumed")
     
+    def add_status_callback(self, callback: callable) -> None:
+        """Add a callback run when engine status shown in the GUI changes."""
+        if callback not in self.status_callbacks:
+            self.status_callbacks = self.status_callbacks + (callback,)
+    
+    def remove_status_callback(self, callback: callable) -> None:
+        """Remove a status change callback."""
+        if callback in self.status_callbacks:
+            self.status_callbacks = tuple(c for c in self.status_callbacks if c != callback)
+    
+    def notify_status_change(self) -> None:
+        """Notify status callbacks that shots, game, weapon or state changed."""
+        for callback in self.status_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Error in status callback: {e}")
+    
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get current performance metrics."""
         metrics = self.performance_metrics.copy()
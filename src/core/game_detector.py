@@ -81,6 +81,9 @@ class GameDetector:
         # Game database
         self.supported_games: Dict[str, GameInfo] = {}
         self.game_profiles: Dict[str, GameProfile] = {}
+        # Bumped whenever supported_games or game_profiles change, so callers
+        # caching get_supported_games()/get_available_profiles() can tell
+        self.definitions_version = 0
         
         # Detection state
         self.current_game: Optional[GameInfo] = None
@@ -211,6 +214,8 @@ class GameDetector:
             
         except Exception as e:
             self.logger.error(f"Error loading game definitions: {e}")
+        
+        self.definitions_version += 1
     
     def _load_game_profiles(self) -> None:
         """Load game-specific configuration profiles."""
@@ -261,6 +266,8 @@ class GameDetector:
             
         except Exception as e:
             self.logger.error(f"Error loading game profiles: {e}")
+        
+        self.definitions_version += 1
     
     async def _monitoring_loop(self) -> None:
         """Main monitoring loop for game detection."""
@@ -349,6 +356,9 @@ class GameDetector:
             
             self.current_game = new_game
             
+            if hasattr(self.engine, 'notify_status_change'):
+                self.engine.notify_status_change()
+            
         except Exception as e:
             self.logger.error(f"Error handling game change: {e}")
     
@@ -441,6 +451,7 @@ class GameDetector:
         """Add a custom game definition."""
         try:
             self.supported_games[game_info.name] = game_info
+            self.definitions_version += 1
             self.logger.info(f"Added custom game: {game_info.display_name}")
             return True
             
@@ -452,6 +463,7 @@ class GameDetector:
         """Add a custom game profile."""
         try:
             self.game_profiles[profile.game_name] = profile
+            self.definitions_version += 1
             self.logger.info(f"Added custom profile: {profile.display_name}")
             return True
             
@@ -4,13 +4,17 @@ Advanced machine learning for adaptive recoil pattern recognition and compensati
 """
 
 import asyncio
+import heapq
 import logging
 import pickle
 import json
-from typing import Dict, List, Optional, Tuple, Any
+import os
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import time
+from array import array
 
 try:
     from sklearn.ensemble import RandomForestRegressor
@@ -67,6 +71,89 @@ class ShotData:
     player_input: Tuple[float, float]
 
 
+class ShotBuffer:
+    """
+    Fixed-capacity columnar ring buffer of per-shot pattern samples.
+    
+    Each column is a packed float32 array, so a full 500-shot pattern
+    costs a few kilobytes instead of one dict of tuples per shot.
+    """
+    
+    COLUMNS = ('shot_number', 'expected_x', 'expected_y', 'movement_x', 'movement_y', 'accuracy')
+    
+    def __init__(self, capacity: int = 500):
+        self.capacity = capacity
+        self.columns: Dict[str, array] = {
+            name: array('f', bytes(4 * capacity)) for name in self.COLUMNS
+        }
+        self.head = 0
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def append(self, shot_data: ShotData) -> None:
+        """Store a shot, overwriting the oldest one when full."""
+        values = (
+            shot_data.shot_number,
+            shot_data.expected_recoil[0],
+            shot_data.expected_recoil[1],
+            shot_data.mouse_movement[0],
+            shot_data.mouse_movement[1],
+            shot_data.accuracy_score
+        )
+        
+        for name, value in zip(self.COLUMNS, values):
+            self.columns[name][self.head] = value
+        
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+    
+    def column(self, name: str, last: Optional[int] = None) -> array:
+        """Get a column in insertion order, optionally only the last N values."""
+        values = self.columns[name]
+        n = self.count if last is None else min(last, self.count)
+        start = (self.head - n) % self.capacity
+        
+        if start + n <= self.capacity:
+            return values[start:start + n]
+        return values[start:] + values[:self.head]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the buffer for JSON persistence."""
+        return {
+            'capacity': self.capacity,
+            'columns': {name: self.column(name).tolist() for name in self.COLUMNS}
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Any, capacity: int = 500) -> 'ShotBuffer':
+        """Restore a buffer from JSON, including the legacy list-of-dicts format."""
+        if isinstance(data, list):
+            columns = {
+                'shot_number': [s['shot_number'] for s in data],
+                'expected_x': [s['expected_recoil'][0] for s in data],
+                'expected_y': [s['expected_recoil'][1] for s in data],
+                'movement_x': [s['actual_movement'][0] for s in data],
+                'movement_y': [s['actual_movement'][1] for s in data],
+                'accuracy': [s['accuracy'] for s in data]
+            }
+        else:
+            capacity = data.get('capacity', capacity)
+            columns = data['columns']
+        
+        buffer = cls(capacity)
+        count = min(len(columns['shot_number']), capacity)
+        
+        for name in cls.COLUMNS:
+            values = columns[name][-count:] if count else []
+            buffer.columns[name][:count] = array('f', values)
+        
+        buffer.count = count
+        buffer.head = count % capacity
+        return buffer
+
+
 @dataclass
 class PatternMetrics:
     """Metrics for pattern recognition performance."""
@@ -98,19 +185,41 @@ class PatternAI:
         self.recoil_model: Optional[RandomForestRegressor] = None
         self.scaler: Optional[StandardScaler] = None
         
+        # Prebuilt 1x7 feature rows keyed by (weapon, game)
+        self._feature_templates: Dict[Tuple[str, str], Any] = {}
+        
         # Training data
-        self.shot_history: List[ShotData] = []
         self.max_history_size = 10000
+        self.shot_history: Deque[ShotData] = deque(maxlen=self.max_history_size)
+        self.retrain_interval = 100  # Retrain every 100 shots
+        self._shots_since_retrain = 0
         
         # Pattern cache
         self.learned_patterns: Dict[str, Dict] = {}
         self.pattern_metrics: Dict[str, PatternMetrics] = {}
         
+        # Pattern expiry (min-heap of (last_updated, pattern_key))
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._last_sweep = 0.0
+        self.pattern_max_age = 86400 * 7  # 7 days
+        self.pattern_sweep_interval = 3600.0  # 1 hour
+        
+        # Running totals backing get_pattern_metrics
+        self._total_shots = 0
+        self._confidence_sum = 0.0
+        
         # Configuration
         self.learning_enabled = True
         self.adaptation_rate = 0.1
         self.confidence_threshold = 0.7
         self.min_samples_for_learning = 50
+        # Use at most half the logical cores so training never starves the
+        # real-time input and engine threads
+        self.training_jobs = max(1, (os.cpu_count() or 4) // 2)
+        self.drift_tolerance = 1e-3
+        self._last_train_stats: Optional[Tuple[Any, Any]] = None
+        self.pattern_update_interval = 8  # Shots batched per pattern cache update
+        self._pending_shots: List[ShotData] = []
         
         # Model paths
         self.model_dir = Path("data/models")
@@ -149,6 +258,7 @@ class PatternAI:
         """Clean up AI resources."""
         try:
             # Save models and data
+            self._flush_pending_shots()
             await self._save_models()
             await self._save_training_data()
             
@@ -176,11 +286,43 @@ class PatternAI:
             if patterns_file.exists():
                 with open(patterns_file, 'r') as f:
                     self.learned_patterns = json.load(f)
+                for pattern in self.learned_patterns.values():
+                    pattern['shots'] = ShotBuffer.from_dict(pattern['shots'])
+                self._clamp_pattern_confidences()
+                self._rebuild_expiry_heap()
+                self._recount_pattern_totals()
                 self.logger.info(f"Loaded {len(self.learned_patterns)} learned patterns")
             
         except Exception as e:
             self.logger.error(f"Error loading models: {e}")
     
+    def _clamp_pattern_confidences(self) -> None:
+        """Clamp persisted pattern confidences into [0, 1]."""
+        out_of_range = 0
+        
+        for pattern in self.learned_patterns.values():
+            confidence = float(pattern.get('pattern_confidence', 0.0))
+            clamped = max(0.0, min(1.0, confidence))
+            if clamped != confidence:
+                out_of_range += 1
+            pattern['pattern_confidence'] = clamped
+        
+        if out_of_range:
+            self.logger.warning(f"Clamped {out_of_range} out-of-range pattern confidences")
+    
+    def _rebuild_expiry_heap(self) -> None:
+        """Rebuild the pattern expiry heap from the learned patterns."""
+        self._expiry_heap = [
+            (pattern['last_updated'], pattern_key)
+            for pattern_key, pattern in self.learned_patterns.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+    
+    def _recount_pattern_totals(self) -> None:
+        """Recompute running pattern totals from the learned patterns."""
+        self._total_shots = sum(len(p['shots']) for p in self.learned_patterns.values())
+        self._confidence_sum = sum(p['pattern_confidence'] for p in self.learned_patterns.values())
+    
     async def _save_models(self) -> None:
         """Save trained models."""
         try:
@@ -196,8 +338,12 @@ class PatternAI:
             
             # Save pattern cache
             patterns_file = self.model_dir / "learned_patterns.json"
+            serialized = {
+                pattern_key: {**pattern, 'shots': pattern['shots'].to_dict()}
+                for pattern_key, pattern in self.learned_patterns.items()
+            }
             with open(patterns_file, 'w') as f:
-                json.dump(self.learned_patterns, f, indent=2)
+                json.dump(serialized, f, indent=2)
             self.logger.debug("Saved learned patterns")
             
         except Exception as e:
@@ -210,11 +356,8 @@ class PatternAI:
             
             if data_file.exists():
                 with open(data_file, 'rb') as f:
-                    self.shot_history = pickle.load(f)
-                
-                # Limit history size
-                if len(self.shot_history) > self.max_history_size:
-                    self.shot_history = self.shot_history[-self.max_history_size:]
+                    # Bounded deque keeps only the most recent shots
+                    self.shot_history = deque(pickle.load(f), maxlen=self.max_history_size)
                 
                 self.logger.info(f"Loaded {len(self.shot_history)} historical shots")
             
@@ -245,7 +388,7 @@ class PatternAI:
                 n_estimators=100,
                 max_depth=20,
                 random_state=42,
-                n_jobs=-1
+                n_jobs=self.training_jobs
             )
             
             # Create scaler
@@ -262,27 +405,35 @@ class PatternAI:
     
     def record_shot(self, shot_data: ShotData) -> None:
         """Record a shot for learning purposes."""
+        if not self.learning_enabled:
+            return
+        
+        # Add to history (bounded deque drops the oldest shot)
+        self.shot_history.append(shot_data)
+        self._pending_shots.append(shot_data)
+        self._shots_since_retrain += 1
+        
+        if len(self._pending_shots) < self.pattern_update_interval:
+            return
+        
         try:
-            if not self.learning_enabled:
-                return
-            
-            # Add to history
-            self.shot_history.append(shot_data)
-            
-            # Limit history size
-            if len(self.shot_history) > self.max_history_size:
-                self.shot_history.pop(0)
-            
-            # Update pattern cache
-            self._update_pattern_cache(shot_data)
+            # Update pattern cache in batches
+            self._flush_pending_shots()
             
             # Trigger retraining if we have enough new samples
-            if len(self.shot_history) % 100 == 0:  # Retrain every 100 shots
+            if self._shots_since_retrain >= self.retrain_interval:
+                self._shots_since_retrain = 0
                 asyncio.create_task(self._retrain_model())
             
         except Exception as e:
             self.logger.error(f"Error recording shot: {e}")
     
+    def _flush_pending_shots(self) -> None:
+        """Apply batched shots to the pattern cache."""
+        pending, self._pending_shots = self._pending_shots, []
+        for shot_data in pending:
+            self._update_pattern_cache(shot_data)
+    
     def _update_pattern_cache(self, shot_data: ShotData) -> None:
         """Update cached patterns with new shot data."""
         try:
@@ -290,36 +441,34 @@ class PatternAI:
             
             if pattern_key not in self.learned_patterns:
                 self.learned_patterns[pattern_key] = {
-                    'shots': [],
+                    'shots': ShotBuffer(),
                     'average_recoil': [0.0, 0.0],
                     'pattern_confidence': 0.0,
                     'last_updated': time.time()
                 }
+                heapq.heappush(self._expiry_heap, (self.learned_patterns[pattern_key]['last_updated'], pattern_key))
             
             pattern = self.learned_patterns[pattern_key]
+            shots = pattern['shots']
             
-            # Add shot data
-            pattern['shots'].append({
-                'shot_number': shot_data.shot_number,
-                'expected_recoil': shot_data.expected_recoil,
-                'actual_movement': shot_data.mouse_movement,
-                'accuracy': shot_data.accuracy_score
-            })
-            
-            # Limit stored shots
-            if len(pattern['shots']) > 500:
-                pattern['shots'] = pattern['shots'][-500:]
+            # Add shot data (ring buffer overwrites the oldest shot when full)
+            stored_before = len(shots)
+            shots.append(shot_data)
+            self._total_shots += len(shots) - stored_before
             
             # Update average recoil
-            if pattern['shots']:
-                avg_x = np.mean([s['expected_recoil'][0] for s in pattern['shots']])
-                avg_y = np.mean([s['expected_recoil'][1] for s in pattern['shots']])
-                pattern['average_recoil'] = [float(avg_x), float(avg_y)]
-            
-            # Update confidence based on consistency
-            if len(pattern['shots']) >= 10:
-                recoil_variance = np.var([s['expected_recoil'] for s in pattern['shots'][-50:]])
-                pattern['pattern_confidence'] = max(0.0, min(1.0, 1.0 - recoil_variance))
+            avg_x = np.mean(shots.column('expected_x'))
+            avg_y = np.mean(shots.column('expected_y'))
+            pattern['average_recoil'] = [float(avg_x), float(avg_y)]
+            
+            # Update confidence based on consistency (per-axis variance, averaged)
+            if len(shots) >= 10:
+                x_variance = np.var(shots.column('expected_x', last=50))
+                y_variance = np.var(shots.column('expected_y', last=50))
+                recoil_variance = float(x_variance + y_variance) / 2.0
+                confidence = max(0.0, min(1.0, 1.0 - recoil_variance))
+                self._confidence_sum += confidence - pattern['pattern_confidence']
+                pattern['pattern_confidence'] = confidence
             
             pattern['last_updated'] = time.time()
             
@@ -341,6 +490,15 @@ class PatternAI:
                 self.logger.warning("Not enough training data for retraining")
                 return
             
+            # Skip the fit if the target distribution has not shifted
+            target_stats = (targets.mean(axis=0), targets.std(axis=0))
+            if self._last_train_stats is not None:
+                prev_mean, prev_std = self._last_train_stats
+                if (np.allclose(target_stats[0], prev_mean, atol=self.drift_tolerance) and
+                        np.allclose(target_stats[1], prev_std, atol=self.drift_tolerance)):
+                    self.logger.info("No drift in training targets - skipping retrain")
+                    return
+            
             # Split data
             X_train, X_test, y_train, y_test = train_test_split(
                 features, targets, test_size=0.2, random_state=42
@@ -352,6 +510,7 @@ class PatternAI:
             
             # Train model
             self.recoil_model.fit(X_train_scaled, y_train)
+            self._last_train_stats = target_stats
             
             # Evaluate model
             y_pred = self.recoil_model.predict(X_test_scaled)
@@ -367,29 +526,36 @@ class PatternAI:
     
     def _prepare_training_data(self) -> Tuple[Any, Any]:
         """Prepare training data from shot history."""
-        features = []
-        targets = []
-        
         try:
-            for shot in self.shot_history:
-                # Feature vector: [shot_number, weapon_hash, game_hash, 
-                #                 mouse_movement_x, mouse_movement_y,
-                #                 player_input_x, player_input_y]
-                feature = [
-                    shot.shot_number,
-                    hash(shot.weapon) % 1000,  # Simple hash for categorical
-                    hash(shot.game) % 1000,
-                    shot.mouse_movement[0],
-                    shot.mouse_movement[1],
-                    shot.player_input[0],
-                    shot.player_input[1]
-                ]
-                
-                # Target: expected recoil compensation
-                target = [shot.expected_recoil[0], shot.expected_recoil[1]]
-                
-                features.append(feature)
-                targets.append(target)
+            shots = self.shot_history
+            
+            # Feature vector: [shot_number, weapon_hash, game_hash, 
+            #                 mouse_movement_x, mouse_movement_y,
+            #                 player_input_x, player_input_y]
+            features = np.fromiter(
+                (
+                    value
+                    for shot in shots
+                    for value in (
+                        shot.shot_number,
+                        hash(shot.weapon) % 1000,  # Simple hash for categorical
+                        hash(shot.game) % 1000,
+                        shot.mouse_movement[0],
+                        shot.mouse_movement[1],
+                        shot.player_input[0],
+                        shot.player_input[1]
+                    )
+                ),
+                dtype=np.float32,
+                count=7 * len(shots)
+            ).reshape(-1, 7)
+            
+            # Target: expected recoil compensation
+            targets = np.fromiter(
+                (value for shot in shots for value in shot.expected_recoil),
+                dtype=np.float32,
+                count=2 * len(shots)
+            ).reshape(-1, 2)
             
             return features, targets
             
@@ -397,6 +563,26 @@ class PatternAI:
             self.logger.error(f"Error preparing training data: {e}")
             return [], []
     
+    def _get_feature_template(self, weapon: str, game: str) -> Any:
+        """Get the cached 1x7 feature row for a weapon/game combination."""
+        key = (weapon, game)
+        template = self._feature_templates.get(key)
+        
+        if template is None:
+            # Only the shot number (column 0) varies between predictions
+            template = np.array([[
+                0.0,
+                hash(weapon) % 1000,
+                hash(game) % 1000,
+                0.0,  # No mouse movement yet
+                0.0,
+                0.0,  # No player input yet
+                0.0
+            ]], dtype=np.float32)
+            self._feature_templates[key] = template
+        
+        return template
+    
     def get_adaptive_adjustment(self, pattern, shot_index: int) -> Optional[Tuple[float, float]]:
         """Get AI-powered adaptive adjustment for recoil compensation."""
         try:
@@ -404,15 +590,8 @@ class PatternAI:
                 return None
             
             # Prepare input features
-            features = [
-                shot_index,
-                hash(pattern.weapon_name) % 1000,
-                hash(pattern.game) % 1000,
-                0.0,  # No mouse movement yet
-                0.0,
-                0.0,  # No player input yet
-                0.0
-            ]
+            features = self._get_feature_template(pattern.weapon_name, pattern.game)
+            features[0, 0] = shot_index
             
             # Scale features
             features_scaled = self.scaler.transform(features)
@@ -447,14 +626,14 @@ class PatternAI:
             
             # Calculate statistics
             shots = pattern['shots']
-            accuracies = [s['accuracy'] for s in shots]
+            accuracies = shots.column('accuracy')
             
             analysis = {
                 'weapon': weapon,
                 'game': game,
                 'total_shots': len(shots),
-                'average_accuracy': np.mean(accuracies),
-                'accuracy_std': np.std(accuracies),
+                'average_accuracy': float(np.mean(accuracies)),
+                'accuracy_std': float(np.std(accuracies)),
                 'pattern_confidence': pattern['pattern_confidence'],
                 'average_recoil': pattern['average_recoil'],
                 'last_updated': pattern['last_updated'],
@@ -473,22 +652,14 @@ class PatternAI:
             if not self.recoil_model or not self.scaler:
                 return None
             
-            pattern = []
+            # One feature row per shot, predicted in a single batch
+            features = np.repeat(self._get_feature_template(weapon, game), shot_count, axis=0)
+            features[:, 0] = np.arange(shot_count)
             
-            for i in range(shot_count):
-                features = [
-                    i,
-                    hash(weapon) % 1000,
-                    hash(game) % 1000,
-                    0.0, 0.0, 0.0, 0.0
-                ]
-                
-                features_scaled = self.scaler.transform(features)
-                prediction = self.recoil_model.predict(features_scaled)[0]
-                
-                pattern.append((float(prediction[0]), float(prediction[1])))
+            features_scaled = self.scaler.transform(features)
+            predictions = self.recoil_model.predict(features_scaled)
             
-            return pattern
+            return [(float(x), float(y)) for x, y in predictions]
             
         except Exception as e:
             self.logger.error(f"Error predicting recoil pattern: {e}")
@@ -499,12 +670,26 @@ class PatternAI:
         try:
             # Periodic cleanup and optimization
             current_time = time.time()
-            
-            # Clean old patterns
-            for pattern_key in list(self.learned_patterns.keys()):
-                pattern = self.learned_patterns[pattern_key]
-                if current_time - pattern['last_updated'] > 86400 * 7:  # 7 days
+            if current_time - self._last_sweep < self.pattern_sweep_interval:
+                return
+            self._last_sweep = current_time
+            
+            # Clean old patterns; heap entries may be stale, so re-check the
+            # pattern's real timestamp and re-queue it if it was touched since
+            cutoff = current_time - self.pattern_max_age
+            while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+                _, pattern_key = heapq.heappop(self._expiry_heap)
+                pattern = self.learned_patterns.get(pattern_key)
+                if pattern is None:
+                    continue
+                if pattern['last_updated'] < cutoff:
                     del self.learned_patterns[pattern_key]
+                else:
+                    heapq.heappush(self._expiry_heap, (pattern['last_updated'], pattern_key))
+            
+            # Recompute the running totals exactly, dropping the float error
+            # accumulated by the incremental updates since the last sweep
+            self._recount_pattern_totals()
             
         except Exception as e:
             self.logger.error(f"Error in AI update: {e}")
@@ -515,16 +700,15 @@ class PatternAI:
         """Get AI pattern recognition metrics."""
         try:
             total_patterns = len(self.learned_patterns)
-            total_shots = sum(len(p['shots']) for p in self.learned_patterns.values())
             
             if total_patterns > 0:
-                avg_confidence = np.mean([p['pattern_confidence'] for p in self.learned_patterns.values()])
+                avg_confidence = self._confidence_sum / total_patterns
             else:
                 avg_confidence = 0.0
             
             return {
                 'total_patterns_learned': total_patterns,
-                'total_shots_recorded': total_shots,
+                'total_shots_recorded': self._total_shots,
                 'average_pattern_confidence': avg_confidence,
                 'learning_enabled': self.learning_enabled,
                 'model_trained': self.recoil_model is not None,
@@ -553,6 +737,11 @@ class PatternAI:
     def reset_learning_data(self) -> None:
         """Reset all learning data."""
         self.shot_history.clear()
+        self._pending_shots.clear()
+        self._shots_since_retrain = 0
         self.learned_patterns.clear()
         self.pattern_metrics.clear()
+        self._expiry_heap.clear()
+        self._total_shots = 0
+        self._confidence_sum = 0.0
         self.logger.info("AI learning data reset")
\ No newline at end of file
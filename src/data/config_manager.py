@@ -6,15 +6,108 @@ Comprehensive configuration management with validation and persistence
 import json
 import logging
 import asyncio
+import mmap
+import os
+import shutil
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Iterable, Set
 from dataclasses import dataclass, asdict
-import yaml
 import copy
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+# Allowed values for enumerated settings
+SECURITY_LEVELS = frozenset({'low', 'medium', 'high', 'maximum'})
+THEMES = frozenset({'dark', 'light'})
+CHART_BACKENDS = frozenset({'mpl', 'tk'})
+LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+
+# Results of a per-key schema check
+CHECK_OK = 0
+CHECK_BAD_TYPE = 1
+CHECK_BAD_VALUE = 2
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 16 * 1024
+
+# Imported JSON files at least this large are stream-parsed section by section
+STREAM_IMPORT_THRESHOLD = 1024 * 1024
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize configuration data to indented JSON bytes."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+
+def _json_dumps_line(data: Any) -> bytes:
+    """Serialize data to a single compact JSON line."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str) + b"\n"
+    return json.dumps(data, separators=(',', ':'), default=str).encode('utf-8') + b"\n"
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+def _copy_json_tree(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep-copy JSON-compatible configuration data."""
+    if orjson:
+        # C-level round trip is much faster than copy.deepcopy's dispatch
+        return orjson.loads(orjson.dumps(data))
+    return copy.deepcopy(data)
+
+
+def _read_json_file(path: Path) -> Any:
+    """Read and parse a JSON file, memory-mapping it when large."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return _json_loads(f.read())
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _json_loads(view)
+
+
+class _ConfigFileHandler(FileSystemEventHandler):
+    """Forwards writes to the user settings files to the config manager (runs on the observer thread)."""
+    
+    def __init__(self, manager: 'ConfigManager'):
+        super().__init__()
+        self.manager = manager
+    
+    def on_modified(self, event) -> None:
+        self.manager._on_config_file_changed(event.src_path)
+    
+    def on_created(self, event) -> None:
+        self.manager._on_config_file_changed(event.src_path)
+    
+    def on_moved(self, event) -> None:
+        self.manager._on_config_file_changed(event.dest_path)
+
+
+@dataclass(slots=True)
 class ConfigSchema:
     """Configuration schema definition."""
     key: str
@@ -38,7 +131,7 @@ class ConfigManager:
     - Event-driven configuration changes
     """
     
-    def __init__(self, config_dir: Optional[str] = None):
+    def __init__(self, config_dir: Optional[str] = None, watch: bool = True):
         self.logger = logging.getLogger(__name__)
         
         # Configuration directory
@@ -50,21 +143,58 @@ class ConfigManager:
         self.config_dir = config_dir
         self.config_dir.mkdir(exist_ok=True)
         
-        # Configuration data
+        # Configuration file paths
+        self._default_file = self.config_dir / "default_settings.json"
+        self._user_file = self.config_dir / "user_settings.json"
+        self._backup_file = self.config_dir / "user_settings.backup.json"
+        self._delta_file = self.config_dir / "user_settings.delta.jsonl"
+        self._temp_file = self.config_dir / "user_settings.json.tmp"
+        
+        # Configuration data (flat, keyed by dotted path)
         self.config: Dict[str, Any] = {}
         self.default_config: Dict[str, Any] = {}
         self.schema: Dict[str, ConfigSchema] = {}
         
+        # Split dotted keys, used when nesting the config for serialization
+        self._split_cache: Dict[str, tuple] = {}
+        self._checkers: Dict[str, callable] = {}
+        
         # Change tracking
-        self.change_callbacks: List[callable] = []
+        # Immutable so notification can iterate while callbacks are added/removed
+        self.change_callbacks: tuple = ()
         self.dirty_keys: set = set()
         self.last_save_time: Optional[datetime] = None
         
+        # Debounced saving
+        self.save_delay = 0.25  # seconds
+        self._save_task: Optional[asyncio.Task] = None
+        
+        # Incremental saves append changed keys to a delta log, which is
+        # compacted into the main file once it grows past the threshold
+        self.delta_compact_threshold = 64 * 1024  # bytes
+        self.backup_interval = 10  # Full saves between backups
+        self._full_saves = 0
+        
+        # External change detection (mtimes of our own writes are ignored).
+        # The lock is held across each write and its mtime record, so the
+        # observer thread cannot see our own write before it is recorded
+        self._observer = None
+        self._own_write_mtimes: Dict[str, int] = {}
+        self._write_lock = threading.Lock()
+        
+        # Loop of the thread that owns the config; external reloads are run on it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reload_pending = False
+        self._reloading = False
+        
         # Load configuration
         self._define_schema()
         self._load_default_config()
         self._load_user_config()
         
+        if watch:
+            self.start_watching()
+        
         self.logger.info("Configuration manager initialized")
     
     def _define_schema(self) -> None:
@@ -116,14 +246,14 @@ class ConfigManager:
                 'security.level': ConfigSchema(
                     'security.level', str, 'high',
                     'Security level (low, medium, high, maximum)',
-                    validator=lambda x: x in ['low', 'medium', 'high', 'maximum']
+                    validator=SECURITY_LEVELS.__contains__
                 ),
                 
                 # GUI settings
                 'gui.theme': ConfigSchema(
                     'gui.theme', str, 'dark',
                     'GUI theme (dark, light)',
-                    validator=lambda x: x in ['dark', 'light']
+                    validator=THEMES.__contains__
                 ),
                 'gui.window_size': ConfigSchema(
                     'gui.window_size', list, [1200, 800],
@@ -133,6 +263,11 @@ class ConfigManager:
                     'gui.always_on_top', bool, False,
                     'Keep window always on top'
                 ),
+                'gui.chart_backend': ConfigSchema(
+                    'gui.chart_backend', str, 'mpl',
+                    'Dashboard chart renderer (mpl, tk)',
+                    validator=CHART_BACKENDS.__contains__
+                ),
                 
                 # Hotkeys
                 'hotkeys.toggle_engine': ConfigSchema(
@@ -175,7 +310,7 @@ class ConfigManager:
                 'logging.level': ConfigSchema(
                     'logging.level', str, 'INFO',
                     'Logging level',
-                    validator=lambda x: x in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+                    validator=LOG_LEVELS.__contains__
                 ),
                 'logging.file_enabled': ConfigSchema(
                     'logging.file_enabled', bool, True,
@@ -188,27 +323,75 @@ class ConfigManager:
             }
             
             self.schema = schemas
+            self._split_cache = {key: tuple(key.split('.')) for key in schemas}
+            self._checkers = {key: self._make_checker(schema) for key, schema in schemas.items()}
             self.logger.debug(f"Defined {len(schemas)} configuration schemas")
             
         except Exception as e:
             self.logger.error(f"Error defining schema: {e}")
     
+    @staticmethod
+    def _make_checker(schema: ConfigSchema) -> callable:
+        """
+        Build a per-key check combining type validation, int->float
+        widening and the custom validator.
+        
+        The returned function maps a value to (status, value), where
+        status is one of CHECK_OK, CHECK_BAD_TYPE or CHECK_BAD_VALUE and
+        value is the (possibly widened) value. A variant is specialized
+        for each (float or not) x (validator or not) combination so the
+        hot path carries no branches that are constant for the key.
+        """
+        expected_type = schema.type
+        validator = schema.validator
+        
+        if expected_type is float and validator is None:
+            def check(value: Any) -> tuple:
+                if isinstance(value, float):
+                    return CHECK_OK, value
+                if isinstance(value, int):
+                    return CHECK_OK, float(value)
+                return CHECK_BAD_TYPE, value
+        
+        elif expected_type is float:
+            def check(value: Any) -> tuple:
+                if not isinstance(value, float):
+                    if not isinstance(value, int):
+                        return CHECK_BAD_TYPE, value
+                    value = float(value)
+                return (CHECK_OK if validator(value) else CHECK_BAD_VALUE), value
+        
+        elif validator is None:
+            def check(value: Any) -> tuple:
+                return (CHECK_OK if isinstance(value, expected_type) else CHECK_BAD_TYPE), value
+        
+        else:
+            def check(value: Any) -> tuple:
+                if not isinstance(value, expected_type):
+                    return CHECK_BAD_TYPE, value
+                return (CHECK_OK if validator(value) else CHECK_BAD_VALUE), value
+        
+        return check
+    
     def _load_default_config(self) -> None:
         """Load default configuration."""
         try:
             # Generate default config from schema
-            for key, schema in self.schema.items():
-                self._set_nested_value(self.default_config, key, schema.default)
+            self.default_config = {key: schema.default for key, schema in self.schema.items()}
             
             # Try to load from default config file
-            default_file = self.config_dir / "default_settings.json"
+            default_file = self._default_file
+            file_defaults = {}
             if default_file.exists():
-                with open(default_file, 'r') as f:
-                    file_defaults = json.load(f)
-                    self._merge_config(self.default_config, file_defaults)
+                file_defaults = _read_json_file(default_file)
+                self._merge_config(self.default_config, file_defaults)
             
             # Initialize config with defaults
-            self.config = copy.deepcopy(self.default_config)
+            self.config = _copy_json_tree(self.default_config)
+            
+            # Schema defaults are valid by definition; only check file overrides
+            if file_defaults:
+                self._validate_config(self._flatten(file_defaults))
             
             self.logger.info("Default configuration loaded")
             
@@ -218,47 +401,82 @@ class ConfigManager:
     def _load_user_config(self) -> None:
         """Load user configuration."""
         try:
-            config_file = self.config_dir / "user_settings.json"
+            config_file = self._user_file
             
             if config_file.exists():
-                with open(config_file, 'r') as f:
-                    user_config = json.load(f)
+                user_config = _read_json_file(config_file)
                 
                 # Merge with current config
                 self._merge_config(self.config, user_config)
+                touched_keys = set(self._flatten(user_config))
+                touched_keys.update(self._replay_delta())
                 self.logger.info("User configuration loaded")
+                
+                # Validate only the keys the user configuration overrides
+                self._validate_config(touched_keys)
             else:
                 self.logger.info("No user configuration found, using defaults")
             
-            # Validate configuration
-            self._validate_config()
-            
         except Exception as e:
             self.logger.error(f"Error loading user config: {e}")
     
-    def _validate_config(self) -> None:
-        """Validate configuration against schema."""
+    def _replay_delta(self) -> Set[str]:
+        """
+        Apply changes recorded in the delta log on top of the loaded config.
+        
+        Returns the leaf keys the replayed entries touched.
+        """
+        delta_file = self._delta_file
+        touched_keys = set()
+        if not delta_file.exists():
+            return touched_keys
+        
+        applied = 0
+        with open(delta_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                except ValueError:
+                    # Partially written trailing line
+                    self.logger.warning("Skipping corrupt configuration delta entry")
+                    continue
+                key, value = entry['k'], entry['v']
+                self._store(self.config, key, value)
+                if isinstance(value, dict):
+                    touched_keys.update(self._flatten(value, f"{key}."))
+                else:
+                    touched_keys.add(key)
+                applied += 1
+        
+        self.logger.debug(f"Replayed {applied} configuration delta entries")
+        return touched_keys
+    
+    def _validate_config(self, keys: Optional[Iterable[str]] = None) -> None:
+        """Validate configuration against schema, optionally only the given keys."""
         try:
             errors = []
             
-            for key, schema in self.schema.items():
+            if keys is None:
+                entries = self.schema.items()
+            else:
+                entries = [(key, self.schema[key]) for key in keys if key in self.schema]
+            
+            for key, schema in entries:
                 try:
                     value = self.get(key)
+                    status, checked = self._checkers[key](value)
                     
-                    # Type validation
-                    if not isinstance(value, schema.type):
-                        if schema.type == float and isinstance(value, int):
-                            # Allow int->float conversion
-                            self.set(key, float(value))
-                        else:
-                            errors.append(f"Invalid type for {key}: expected {schema.type.__name__}, got {type(value).__name__}")
-                            continue
+                    if status == CHECK_BAD_TYPE:
+                        errors.append(f"Invalid type for {key}: expected {schema.type.__name__}, got {type(value).__name__}")
+                        continue
                     
-                    # Custom validator
-                    if schema.validator and not schema.validator(value):
+                    if status == CHECK_BAD_VALUE:
                         errors.append(f"Validation failed for {key}: {value}")
                         # Reset to default
                         self.set(key, schema.default)
+                    elif checked is not value:
+                        # Allow int->float conversion
+                        self.set(key, checked)
                 
                 except KeyError:
                     if schema.required:
@@ -274,100 +492,151 @@ class ConfigManager:
             self.logger.error(f"Error validating config: {e}")
     
     def _merge_config(self, target: Dict[str, Any], source: Dict[str, Any]) -> None:
-        """Merge source configuration into target."""
-        for key, value in source.items():
-            if isinstance(value, dict) and key in target and isinstance(target[key], dict):
-                self._merge_config(target[key], value)
-            else:
-                target[key] = value
+        """Merge a nested source configuration into a flat target."""
+        for key, value in self._flatten(source).items():
+            self._store(target, key, value)
+    
+    def _split_key(self, key: str) -> tuple:
+        """Split a dotted key, caching the result."""
+        keys = self._split_cache.get(key)
+        if keys is None:
+            keys = tuple(key.split('.'))
+            self._split_cache[key] = keys
+        return keys
     
-    def _set_nested_value(self, config: Dict[str, Any], key: str, value: Any) -> None:
-        """Set a nested configuration value."""
-        keys = key.split('.')
-        current = config
+    @staticmethod
+    def _flatten(tree: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+        """Flatten a nested config tree into a dotted-key dict of leaves."""
+        flat = {}
+        stack = [(prefix, tree)]
         
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
+        while stack:
+            current_prefix, node = stack.pop()
+            for k, v in node.items():
+                full_key = f"{current_prefix}{k}"
+                if isinstance(v, dict):
+                    stack.append((f"{full_key}.", v))
+                else:
+                    flat[full_key] = v
         
-        current[keys[-1]] = value
+        return flat
     
-    def _get_nested_value(self, config: Dict[str, Any], key: str) -> Any:
-        """Get a nested configuration value."""
-        keys = key.split('.')
-        current = config
+    def _to_nested(self, flat: Dict[str, Any]) -> Dict[str, Any]:
+        """Expand a flat dotted-key dict into a nested config tree."""
+        tree = {}
         
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                raise KeyError(f"Configuration key not found: {key}")
+        for key, value in flat.items():
+            *parents, leaf = self._split_key(key)
+            node = tree
+            for part in parents:
+                node = node.setdefault(part, {})
+            node[leaf] = value
         
-        return current
+        return tree
+    
+    def _store(self, config: Dict[str, Any], key: str, value: Any) -> None:
+        """Store a value in a flat config, replacing any overlapping keys."""
+        if key not in config:
+            # New key or section - drop the leaves it replaces and any
+            # ancestor stored as a leaf
+            prefix = f"{key}."
+            for existing in [k for k in config if k.startswith(prefix)]:
+                del config[existing]
+            
+            parts = self._split_key(key)
+            for i in range(1, len(parts)):
+                config.pop('.'.join(parts[:i]), None)
+        elif isinstance(value, dict):
+            del config[key]
+        
+        if isinstance(value, dict):
+            config.update(self._flatten(value, f"{key}."))
+        else:
+            config[key] = value
+    
+    def _get_section(self, config: Dict[str, Any], key: str) -> Dict[str, Any]:
+        """Build the nested subtree stored under a section key."""
+        prefix = f"{key}."
+        section = {k[len(prefix):]: v for k, v in config.items() if k.startswith(prefix)}
+        
+        if not section:
+            raise KeyError(f"Configuration key not found: {key}")
+        
+        return self._to_nested(section)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
         try:
-            return self._get_nested_value(self.config, key)
+            return self.config[key]
+        except KeyError:
+            pass
+        
+        try:
+            return self._get_section(self.config, key)
         except KeyError:
             if default is not None:
                 return default
-            
-            # Try to get from default config
-            try:
-                return self._get_nested_value(self.default_config, key)
-            except KeyError:
-                if default is not None:
-                    return default
-                raise
+        
+        # Try to get from default config
+        if key in self.default_config:
+            return self.default_config[key]
+        return self._get_section(self.default_config, key)
     
     def set(self, key: str, value: Any, save: bool = True) -> bool:
         """Set configuration value."""
-        try:
-            # Validate against schema
-            if key in self.schema:
-                schema = self.schema[key]
-                
-                # Type validation
-                if not isinstance(value, schema.type):
-                    if schema.type == float and isinstance(value, int):
-                        value = float(value)
-                    else:
-                        self.logger.error(f"Invalid type for {key}: expected {schema.type.__name__}")
-                        return False
-                
-                # Custom validator
-                if schema.validator and not schema.validator(value):
-                    self.logger.error(f"Validation failed for {key}: {value}")
-                    return False
-            
-            # Get old value for change detection
-            try:
-                old_value = self.get(key)
-            except KeyError:
-                old_value = None
-            
-            # Set the value
-            self._set_nested_value(self.config, key, value)
-            
-            # Track changes
-            if old_value != value:
-                self.dirty_keys.add(key)
-                self._notify_change(key, old_value, value)
+        # Validate against schema
+        checker = self._checkers.get(key)
+        if checker is not None:
+            status, value = checker(value)
             
-            # Auto-save if requested
-            if save:
-                asyncio.create_task(self.save())
-            
-            return True
+            if status == CHECK_BAD_TYPE:
+                self.logger.error(f"Invalid type for {key}: expected {self.schema[key].type.__name__}")
+                return False
             
-        except Exception as e:
-            self.logger.error(f"Error setting config {key}: {e}")
-            return False
+            if status == CHECK_BAD_VALUE:
+                self.logger.error(f"Validation failed for {key}: {value}")
+                return False
+        
+        # Get old value for change detection
+        try:
+            old_value = self.get(key)
+        except KeyError:
+            old_value = None
+        
+        # Set the value
+        self._store(self.config, key, value)
+        
+        # Track changes (_notify_change isolates callback errors)
+        if old_value != value:
+            self.dirty_keys.add(key)
+            self._notify_change(key, old_value, value)
+        
+        # Auto-save if requested
+        if save:
+            self._schedule_save()
+        
+        return True
+    
+    def update(self, values: Dict[str, Any], save: bool = True) -> Dict[str, bool]:
+        """
+        Set several configuration values at once.
+        
+        Each value is validated and applied like set(), but at most one
+        save is scheduled for the whole batch. Returns the per-key result.
+        """
+        results = {key: self.set(key, value, save=False) for key, value in values.items()}
+        
+        if save and any(results.values()):
+            self._schedule_save()
+        
+        return results
     
     def _notify_change(self, key: str, old_value: Any, new_value: Any) -> None:
         """Notify change callbacks."""
+        if self._reloading:
+            # load() notifies once per changed key after rebuilding
+            return
+        
         try:
             for callback in self.change_callbacks:
                 try:
@@ -377,19 +646,77 @@ class ConfigManager:
         except Exception as e:
             self.logger.error(f"Error notifying config changes: {e}")
     
-    async def save(self) -> bool:
-        """Save configuration to file."""
+    def _schedule_save(self) -> None:
+        """Schedule a debounced save so bursts of changes produce one write."""
+        if self._save_task is not None and not self._save_task.done():
+            return
+        
         try:
-            config_file = self.config_dir / "user_settings.json"
-            backup_file = self.config_dir / "user_settings.backup.json"
-            
-            # Create backup
-            if config_file.exists():
-                config_file.rename(backup_file)
-            
-            # Save configuration
-            with open(config_file, 'w') as f:
-                json.dump(self.config, f, indent=2, default=str)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called from outside the loop (e.g. a Tk callback while the GUI pumps
+            # the attached loop); the task runs on the loop's next pass
+            loop = self._loop
+            if loop is None or loop.is_closed():
+                # No event loop yet - changes stay dirty until the next save
+                self.logger.debug("No event loop, deferring configuration save")
+                return
+        
+        self._save_task = loop.create_task(self._delayed_save())
+    
+    async def _delayed_save(self) -> None:
+        """Wait for the debounce delay, then save."""
+        await asyncio.sleep(self.save_delay)
+        await self.save()
+    
+    async def save(self, compact: bool = False) -> bool:
+        """
+        Save configuration to file.
+        
+        Changed keys are appended to the delta log; the full file is
+        rewritten when compact is set, when no saved file exists yet, or
+        when the delta log has outgrown delta_compact_threshold.
+        """
+        try:
+            config_file = self._user_file
+            backup_file = self._backup_file
+            delta_file = self._delta_file
+            
+            delta_size = delta_file.stat().st_size if delta_file.exists() else 0
+            
+            # Nothing changed since the last save (and nothing to compact)
+            if not self.dirty_keys and config_file.exists() and not (compact and delta_size):
+                self.logger.debug("Configuration unchanged, skipping save")
+                return True
+            
+            if not compact and config_file.exists() and delta_size < self.delta_compact_threshold:
+                # Incremental save - append only the changed keys
+                lines = [_json_dumps_line({'k': key, 'v': self.get(key)}) for key in sorted(self.dirty_keys)]
+                with self._write_lock:
+                    with open(delta_file, 'ab') as f:
+                        f.writelines(lines)
+                    self._record_own_write(delta_file)
+            else:
+                # Write only the overrides - loading starts from the defaults
+                overrides = self._to_nested(self._get_overrides())
+                
+                # Write to a temp file and swap it in atomically
+                temp_file = self._temp_file
+                with open(temp_file, 'wb') as f:
+                    f.write(_json_dumps(overrides))
+                
+                # Keep a backup of the previous file every few full saves
+                if self._full_saves % self.backup_interval == 0 and config_file.exists():
+                    shutil.copyfile(config_file, backup_file)
+                self._full_saves += 1
+                
+                with self._write_lock:
+                    os.replace(temp_file, config_file)
+                    self._record_own_write(config_file)
+                
+                # Changes are now part of the main file
+                if delta_file.exists():
+                    delta_file.unlink()
             
             # Clear dirty flags
             self.dirty_keys.clear()
@@ -402,10 +729,111 @@ class ConfigManager:
             self.logger.error(f"Error saving configuration: {e}")
             return False
     
+    def start_watching(self) -> bool:
+        """Reload the configuration automatically when its files change on disk."""
+        if Observer is None:
+            self.logger.debug("watchdog not available - config file watching disabled")
+            return False
+        
+        if self._observer is not None:
+            return True
+        
+        try:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.schedule(_ConfigFileHandler(self), str(self.config_dir), recursive=False)
+            self._observer.start()
+            self.logger.debug("Watching configuration directory for changes")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error starting config file watcher: {e}")
+            self._observer = None
+            return False
+    
+    def stop_watching(self) -> None:
+        """Stop watching the configuration files."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5.0)
+            self._observer = None
+    
+    def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Set the event loop of the thread that owns the configuration.
+        
+        External file changes are reloaded on this loop rather than on the
+        watcher thread. A change seen before a loop was attached is
+        reloaded now.
+        """
+        self._loop = loop
+        if self._reload_pending:
+            self._reload_pending = False
+            loop.call_soon(self._reload_external)
+    
+    def _record_own_write(self, path: Path) -> None:
+        """Remember the mtime of a file we wrote so its change event is ignored (call with _write_lock held)."""
+        self._own_write_mtimes[str(path)] = path.stat().st_mtime_ns
+    
+    def _on_config_file_changed(self, path: str) -> None:
+        """Handle a change event for a file in the config directory (observer thread)."""
+        if path not in (str(self._user_file), str(self._delta_file)):
+            return
+        
+        with self._write_lock:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                return
+            
+            if self._own_write_mtimes.get(path) == mtime:
+                return
+            self._own_write_mtimes[path] = mtime
+        
+        self.logger.info(f"Configuration file changed externally: {path}")
+        
+        # Hand the reload to the owner thread; without a loop it waits for attach_loop
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._reload_external)
+                return
+            except RuntimeError:
+                pass  # Loop closed meanwhile
+        self._reload_pending = True
+    
+    def _reload_external(self) -> None:
+        """Reload after an external file change (owner thread)."""
+        self.load()
+    
     def load(self) -> bool:
-        """Reload configuration from file."""
+        """
+        Reload configuration from file.
+        
+        The config is rebuilt from the defaults, so overrides removed from
+        the file are dropped; unsaved local changes are kept. Callbacks are
+        notified once for each key whose value changed.
+        """
         try:
-            self._load_user_config()
+            old_config = self.config
+            
+            self._reloading = True
+            try:
+                self.config = _copy_json_tree(self.default_config)
+                self._load_user_config()
+                
+                for key in self.dirty_keys:
+                    if key in old_config:
+                        self._store(self.config, key, old_config[key])
+            finally:
+                self._reloading = False
+            
+            new_config = self.config
+            for key in old_config.keys() | new_config.keys():
+                old_value = old_config.get(key)
+                new_value = new_config.get(key)
+                if old_value != new_value:
+                    self._notify_change(key, old_value, new_value)
+            
             self.logger.info("Configuration reloaded")
             return True
         except Exception as e:
@@ -415,18 +843,19 @@ class ConfigManager:
     def reset_to_defaults(self) -> bool:
         """Reset configuration to defaults."""
         try:
-            self.config = copy.deepcopy(self.default_config)
+            self.config = _copy_json_tree(self.default_config)
             self.dirty_keys = set(self.config.keys())
             
             # Notify all changes
             for key in self.schema.keys():
                 try:
                     value = self.get(key)
-                    self._notify_change(key, None, value)
-                except:
-                    pass
+                except KeyError:
+                    self.logger.debug(f"No value to notify for {key}")
+                    continue
+                self._notify_change(key, None, value)
             
-            asyncio.create_task(self.save())
+            self._schedule_save()
             self.logger.info("Configuration reset to defaults")
             return True
             
@@ -440,11 +869,12 @@ class ConfigManager:
             file_path = Path(file_path)
             
             if format.lower() == 'json':
-                with open(file_path, 'w') as f:
-                    json.dump(self.config, f, indent=2, default=str)
+                with open(file_path, 'wb') as f:
+                    f.write(_json_dumps(self.get_config_tree()))
             elif format.lower() == 'yaml':
+                import yaml  # Only needed for YAML export
                 with open(file_path, 'w') as f:
-                    yaml.dump(self.config, f, indent=2, default_flow_style=False)
+                    yaml.dump(self.get_config_tree(), f, indent=2, default_flow_style=False)
             else:
                 self.logger.error(f"Unsupported export format: {format}")
                 return False
@@ -467,20 +897,30 @@ class ConfigManager:
             
             # Determine format from extension
             if file_path.suffix.lower() == '.json':
-                with open(file_path, 'r') as f:
-                    imported_config = json.load(f)
+                if ijson and file_path.stat().st_size >= STREAM_IMPORT_THRESHOLD:
+                    sections = self._iter_json_sections(file_path)
+                else:
+                    sections = _read_json_file(file_path).items()
             elif file_path.suffix.lower() in ['.yaml', '.yml']:
+                import yaml  # Only needed for YAML import
                 with open(file_path, 'r') as f:
-                    imported_config = yaml.safe_load(f)
+                    sections = yaml.safe_load(f).items()
             else:
                 self.logger.error(f"Unsupported file format: {file_path.suffix}")
                 return False
             
-            # Merge imported configuration
-            self._merge_config(self.config, imported_config)
-            self._validate_config()
+            # Merge imported configuration one top-level section at a time
+            imported_keys = set()
+            for section, value in sections:
+                section_values = self._flatten({section: value})
+                for key, item in section_values.items():
+                    self._store(self.config, key, item)
+                self.dirty_keys.update(section_values)
+                imported_keys.update(section_values)
+            
+            self._validate_config(imported_keys)
             
-            asyncio.create_task(self.save())
+            self._schedule_save()
             self.logger.info(f"Configuration imported from {file_path}")
             return True
             
@@ -488,15 +928,21 @@ class ConfigManager:
             self.logger.error(f"Error importing configuration: {e}")
             return False
     
+    @staticmethod
+    def _iter_json_sections(file_path: Path) -> Iterable[tuple]:
+        """Stream the top-level (key, value) pairs of a large JSON file."""
+        with open(file_path, 'rb') as f:
+            yield from ijson.kvitems(f, '', use_float=True)
+    
     def add_change_callback(self, callback: callable) -> None:
         """Add configuration change callback."""
         if callback not in self.change_callbacks:
-            self.change_callbacks.append(callback)
+            self.change_callbacks = self.change_callbacks + (callback,)
     
     def remove_change_callback(self, callback: callable) -> None:
         """Remove configuration change callback."""
         if callback in self.change_callbacks:
-            self.change_callbacks.remove(callback)
+            self.change_callbacks = tuple(c for c in self.change_callbacks if c != callback)
     
     def get_schema_info(self, key: str = None) -> Union[Dict[str, ConfigSchema], ConfigSchema]:
         """Get schema information."""
@@ -505,6 +951,18 @@ class ConfigManager:
         else:
             return self.schema.copy()
     
+    def _get_overrides(self) -> Dict[str, Any]:
+        """Get the config entries that differ from the defaults."""
+        defaults = self.default_config
+        return {
+            key: value for key, value in self.config.items()
+            if key not in defaults or defaults[key] != value
+        }
+    
+    def get_config_tree(self) -> Dict[str, Any]:
+        """Get the full configuration as a nested dictionary."""
+        return self._to_nested(self.config)
+    
     def get_all_keys(self) -> List[str]:
         """Get all configuration keys."""
         return list(self.schema.keys())
@@ -3,13 +3,15 @@ Real-time Dashboard for Hassan Ultimate Anti-Recoil
 Advanced analytics and monitoring interface
 """
 
+import json
 import logging
+import os
+import threading
 import tkinter as tk
-from typing import Dict, Any, List, Optional
-import matplotlib.pyplot as plt
+from typing import Dict, Any, List, Optional, Tuple
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
-from collections import deque
 import time
 
 try:
@@ -19,69 +21,287 @@ except ImportError:
     ctk = None
     matplotlib_available = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class MetricsChart:
-    """Real-time metrics chart widget."""
+    """
+    Real-time metrics chart widget.
+    
+    The "mpl" backend draws a full matplotlib plot; the "tk" backend draws a
+    plain sparkline on a Tk canvas, which is much cheaper to update.
+    """
     
-    def __init__(self, parent, title: str, y_label: str, max_points: int = 100):
+    def __init__(self, parent, title: str, y_label: str, max_points: int = 100,
+                 backend: str = "mpl"):
         self.parent = parent
         self.title = title
         self.y_label = y_label
         self.max_points = max_points
         
-        # Data storage
-        self.x_data = deque(maxlen=max_points)
-        self.y_data = deque(maxlen=max_points)
-        
-        # Create matplotlib figure
-        if matplotlib_available:
-            self.fig, self.ax = plt.subplots(figsize=(6, 3))
-            self.ax.set_title(title)
-            self.ax.set_xlabel("Time")
-            self.ax.set_ylabel(y_label)
-            self.line, = self.ax.plot([], [], 'b-')
+        # Data storage: a fixed-capacity ring buffer of values. The x axis is the
+        # sample index, which never changes, so no timestamps are kept.
+        self._x_axis = np.arange(max_points, dtype=np.float64)
+        self._ybuf = np.empty(max_points, dtype=np.float64)
+        # Scratch array for the oldest-first view handed to the renderers
+        self._y_ordered = np.empty(max_points, dtype=np.float64)
+        self._head = 0
+        self._len = 0
+        
+        # Draw-rate limiting, independent of how often samples arrive
+        self.min_draw_interval = 1 / 30
+        self._last_draw = 0.0
+        self._dirty = False
+        
+        # The title lives in a label above the chart, so the plot itself draws no text
+        self.title_label = None
+        if backend == "tk" or matplotlib_available:
+            self.title_label = ctk.CTkLabel(parent, text=title)
+            self.title_label.pack(side="top")
+        
+        if backend == "tk":
+            self.backend = "tk"
+            self.parent = parent
+            self.canvas_widget = tk.Canvas(parent, height=120, highlightthickness=0)
+            self._line_id = self.canvas_widget.create_line(0, 0, 0, 0, fill="blue")
+            self.apply_theme()
+            # Interleaved x/y pixel coordinates, reused for every draw
+            self._coords = np.empty(2 * max_points, dtype=np.float64)
+        elif matplotlib_available:
+            # Create matplotlib figure
+            self.backend = "mpl"
+            # A bare Figure stays out of pyplot's global figure manager, so it is
+            # freed as soon as the chart is
+            self.fig = Figure(figsize=(6, 3))
+            self.ax = self.fig.add_subplot(111)
+            
+            # Streaming sparkline: no ticks, tick labels or frame to lay out and render
+            self.ax.set_xticks([])
+            self.ax.set_yticks([])
+            self.ax.set_frame_on(False)
+            self.fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
+            # The line is animated so it stays out of the cached background
+            self.line, = self.ax.plot([], [], 'b-', animated=True)
+            
+            # Limits are managed by _draw_plot, never by matplotlib's autoscaling.
+            # The x range is the fixed sample window.
+            self.ax.set_autoscale_on(False)
+            self.ax.set_xlim(0, max_points - 1)
+            self.y_margin = 0.1
+            # Refit shrinks the limits once the data fills less than this share of them
+            self.y_shrink_ratio = 0.5
             
             # Create canvas
             self.canvas = FigureCanvasTkAgg(self.fig, parent)
             self.canvas_widget = self.canvas.get_tk_widget()
+            
+            # Blitting state: background without the line, and the limits it was drawn for
+            self._background = None
+            self._shown_limits: Optional[Tuple[float, float]] = None
+            self.canvas.mpl_connect('draw_event', self._on_draw)
+            self.canvas.mpl_connect('resize_event', self._on_resize)
+            self.canvas.draw()
         else:
             # Fallback to simple text display
+            self.backend = None
             self.canvas_widget = ctk.CTkLabel(parent, text=f"{title}: No data")
     
     def add_data_point(self, value: float) -> None:
         """Add a new data point."""
-        if not matplotlib_available:
+        if self.backend is None:
             self.canvas_widget.configure(text=f"{self.title}: {value:.2f}")
             return
         
-        current_time = time.time()
-        self.x_data.append(current_time)
-        self.y_data.append(value)
+        self._ybuf[self._head] = value
+        self._head = (self._head + 1) % self.max_points
+        if self._len < self.max_points:
+            self._len += 1
         
-        # Update plot
-        if len(self.x_data) > 1:
-            # Convert to relative time
-            start_time = self.x_data[0]
-            x_relative = [(t - start_time) for t in self.x_data]
-            
-            self.line.set_data(x_relative, list(self.y_data))
-            self.ax.relim()
-            self.ax.autoscale_view()
-            
+        self._dirty = True
+        if time.monotonic() - self._last_draw >= self.min_draw_interval:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Draw any samples added since the last draw."""
+        if self.backend is None or not self._dirty:
+            return
+        
+        self._dirty = False
+        self._last_draw = time.monotonic()
+        
+        if self._len < 2:
+            return
+        
+        if self.backend == "tk":
+            self._draw_sparkline()
+        else:
+            self._draw_plot()
+    
+    def _draw_sparkline(self) -> None:
+        """Map the buffered samples to canvas pixels and move the line there."""
+        width = max(self.canvas_widget.winfo_width(), 2) - 1
+        height = max(self.canvas_widget.winfo_height(), 2) - 1
+        
+        y_values = self._ordered(self._ybuf, self._y_ordered)
+        ymin = y_values.min()
+        y_span = (y_values.max() - ymin) or 1.0
+        
+        # Map to pixels in place, straight into the interleaved coordinate buffer
+        n = 2 * self._len
+        x_pixels = self._coords[0:n:2]
+        y_pixels = self._coords[1:n:2]
+        np.multiply(self._x_axis[:self._len], width / (self.max_points - 1), out=x_pixels)
+        np.subtract(y_values, ymin, out=y_pixels)
+        y_pixels *= -height / y_span
+        y_pixels += height
+        
+        self.canvas_widget.coords(self._line_id, *self._coords[:n].tolist())
+    
+    def _draw_plot(self) -> None:
+        """Update the matplotlib line, rescaling only when needed."""
+        y_values = self._ordered(self._ybuf, self._y_ordered)
+        self.line.set_data(self._x_axis[:self._len], y_values)
+        
+        # Only move the limits (and pay for a full redraw) when the data leaves
+        # them or has shrunk well inside them; the gap between the two is the hysteresis
+        ymin, ymax = float(y_values.min()), float(y_values.max())
+        margin = (ymax - ymin) * self.y_margin or abs(ymax) * self.y_margin or 1.0
+        fitted = (ymin - margin, ymax + margin)
+        shown = self._shown_limits
+        if (
+            shown is None
+            or ymin < shown[0] or ymax > shown[1]
+            or fitted[1] - fitted[0] < (shown[1] - shown[0]) * self.y_shrink_ratio
+        ):
+            self.ax.set_ylim(*fitted)
+            self._shown_limits = fitted
+            self._background = None
+        
+        self._blit_line()
+    
+    def _ordered(self, buf: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Return the filled part of a ring buffer, oldest sample first.
+        
+        Before the buffer wraps this is a view of buf itself; afterwards the
+        samples are copied into out, so no new array is allocated either way.
+        """
+        if self._len < self.max_points:
+            return buf[:self._len]
+        
+        tail = self.max_points - self._head
+        out[:tail] = buf[self._head:]
+        out[tail:] = buf[:self._head]
+        return out
+    
+    def _blit_line(self) -> None:
+        """Redraw only the line over the cached axes background."""
+        if self._background is None:
             self.canvas.draw()
+        
+        self.canvas.restore_region(self._background)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
+    
+    def _on_draw(self, event) -> None:
+        """Cache the axes background after every full draw."""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+    
+    def _on_resize(self, event) -> None:
+        """Invalidate the cached background when the canvas is resized."""
+        self._background = None
     
     def clear(self) -> None:
         """Clear chart data."""
-        self.x_data.clear()
-        self.y_data.clear()
+        self._head = 0
+        self._len = 0
+        self._dirty = False
         
-        if matplotlib_available:
+        if self.backend == "tk":
+            self.canvas_widget.coords(self._line_id, 0, 0, 0, 0)
+        elif self.backend == "mpl":
             self.line.set_data([], [])
+            self._shown_limits = None
             self.canvas.draw()
     
+    def apply_theme(self) -> None:
+        """Match the tk canvas to its CTk frame in the current appearance mode."""
+        if self.backend != "tk":
+            return
+        
+        dark = ctk.get_appearance_mode() == "Dark"
+        
+        def pick(color):
+            # CTk colors are either one color or a (light, dark) pair
+            return color[dark] if isinstance(color, (tuple, list)) else color
+        
+        background = pick(self.parent.cget("fg_color"))
+        if background == "transparent":
+            background = pick(ctk.ThemeManager.theme["CTkFrame"]["fg_color"])
+        self.canvas_widget.configure(bg=background)
+        self.canvas_widget.itemconfigure(
+            self._line_id, fill=pick(ctk.ThemeManager.theme["CTkButton"]["fg_color"])
+        )
+    
     def get_widget(self):
         """Get the chart widget."""
         return self.canvas_widget
+    
+    def close(self) -> None:
+        """Destroy the chart widget and release the figure."""
+        self.canvas_widget.destroy()
+        if self.title_label is not None:
+            self.title_label.destroy()
+        if self.backend == "mpl":
+            self.line = None
+            self.ax = None
+            self.fig = None
+            self.canvas = None
+            self._background = None
+
+
+class MetricLabel:
+    """A metric value label that only reconfigures itself when its text changes."""
+    
+    __slots__ = ("widget", "text", "number")
+    
+    def __init__(self, widget):
+        self.widget = widget
+        self.text = None
+        self.number = None  # Last value at display resolution
+    
+    def set_text(self, text: str) -> None:
+        """Set the label text if it changed."""
+        if text != self.text:
+            self.text = text
+            self.widget.configure(text=text)
+    
+    def set_number(self, value: float, scale: int, template: str) -> None:
+        """Set a numeric value, formatting it only when the displayed value changes."""
+        quantized = round(value * scale)
+        if quantized != self.number:
+            self.number = quantized
+            self.set_text(template.format(quantized / scale))
+    
+    def set_count(self, count: int) -> None:
+        """Set an integer value, converting it only when the count changes."""
+        if count != self.number:
+            self.number = count
+            self.set_text(str(count))
+
+
+class MetricLabels:
+    """Dashboard value labels, one attribute per metric."""
+    
+    __slots__ = (
+        "engine_state", "current_game", "current_weapon", "auto_detection", "stealth_mode",
+        "avg_latency", "shots_fired", "compensations", "shots_per_minute", "uptime",
+        "security_level", "detection_risk", "randomizations", "stealth_ops", "suspicious_procs",
+        "patterns_learned", "shots_recorded", "pattern_confidence", "learning_enabled", "model_trained",
+    )
 
 
 class Dashboard:
@@ -97,19 +317,55 @@ class Dashboard:
     - AI pattern analysis
     """
     
+    # Label texts indexed by a bool
+    _ENABLED_DISABLED = ("Disabled", "Enabled")
+    _YES_NO = ("No", "Yes")
+    
     def __init__(self, parent, engine, config_manager):
         self.parent = parent
         self.engine = engine
         self.config_manager = config_manager
         self.logger = logging.getLogger(__name__)
         
+        # The updaters read current_weapon directly, so make sure it exists
+        if engine is not None and not hasattr(engine, 'current_weapon'):
+            engine.current_weapon = None
+        
         # Main dashboard frame
         self.dashboard_frame = None
         self.visible = False
         
         # Metric widgets
-        self.metrics_widgets = {}
+        self.labels = MetricLabels()
         self.charts = {}
+        self.chart_backend = config_manager.get('gui.chart_backend', 'mpl') if config_manager else 'mpl'
+        
+        # Refresh timer, only running while the dashboard is visible
+        self.update_interval = 250  # Milliseconds
+        self._after_id = None
+        
+        # Update coalescing: at most one pending refresh
+        self._pending = False
+        # Charts sample on every chart_every-th timer tick (every tick = 4 Hz);
+        # counting ticks avoids dropping samples to after() jitter
+        self.chart_every = 1
+        self._tick_count = 0
+        self._charts_requested = False
+        self._charts_due = False
+        
+        # Sections that raised, and when to try them again
+        self._section_disabled_until: Dict[str, float] = {}
+        self.section_retry_delay = 10.0
+        
+        # Last engine snapshot, shared by the updaters and export_metrics
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self.snapshot_max_age = 1.0
+        
+        # Display strings derived from engine objects, rebuilt only when those change
+        self._cached_state = None
+        self._cached_state_text = ""
+        self._cached_game = None
+        self._cached_game_name = "Not Detected"
         
         # Create dashboard
         self._create_dashboard()
@@ -132,6 +388,9 @@ class Dashboard:
             )
             title_label.grid(row=0, column=0, columnspan=2, pady=20)
             
+            # One header font shared by every section
+            self._header_font = ctk.CTkFont(size=18, weight="bold")
+            
             # Create sections
             self._create_engine_status_section()
             self._create_performance_section()
@@ -144,36 +403,13 @@ class Dashboard:
     def _create_engine_status_section(self) -> None:
         """Create engine status section."""
         try:
-            # Engine Status Frame
-            status_frame = ctk.CTkFrame(self.dashboard_frame)
-            status_frame.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
-            status_frame.grid_columnconfigure(1, weight=1)
-            
-            # Section title
-            title = ctk.CTkLabel(
-                status_frame,
-                text="🎮 Engine Status",
-                font=ctk.CTkFont(size=18, weight="bold")
-            )
-            title.grid(row=0, column=0, columnspan=2, pady=10)
-            
-            # Status indicators
-            status_items = [
+            self._build_kv_section(1, 0, "🎮 Engine Status", (
                 ("Engine State", "engine_state"),
                 ("Current Game", "current_game"),
                 ("Current Weapon", "current_weapon"),
                 ("Auto Detection", "auto_detection"),
                 ("Stealth Mode", "stealth_mode"),
-            ]
-            
-            for i, (label, key) in enumerate(status_items):
-                label_widget = ctk.CTkLabel(status_frame, text=f"{label}:")
-                label_widget.grid(row=i+1, column=0, padx=10, pady=5, sticky="w")
-                
-                value_widget = ctk.CTkLabel(status_frame, text="Unknown")
-                value_widget.grid(row=i+1, column=1, padx=10, pady=5, sticky="w")
-                
-                self.metrics_widgets[key] = value_widget
+            ))
             
         except Exception as e:
             self.logger.error(f"Error creating engine status section: {e}")
@@ -181,44 +417,16 @@ class Dashboard:
     def _create_performance_section(self) -> None:
         """Create performance metrics section."""
         try:
-            # Performance Frame
-            perf_frame = ctk.CTkFrame(self.dashboard_frame)
-            perf_frame.grid(row=1, column=1, padx=10, pady=10, sticky="nsew")
-            perf_frame.grid_columnconfigure(1, weight=1)
-            
-            # Section title
-            title = ctk.CTkLabel(
-                perf_frame,
-                text="⚡ Performance Metrics",
-                font=ctk.CTkFont(size=18, weight="bold")
-            )
-            title.grid(row=0, column=0, columnspan=2, pady=10)
-            
-            # Performance metrics
-            perf_items = [
+            perf_frame = self._build_kv_section(1, 1, "⚡ Performance Metrics", (
                 ("Average Latency", "avg_latency"),
                 ("Shots Fired", "shots_fired"),
                 ("Compensations Applied", "compensations"),
                 ("Shots per Minute", "shots_per_minute"),
                 ("Uptime", "uptime"),
-            ]
-            
-            for i, (label, key) in enumerate(perf_items):
-                label_widget = ctk.CTkLabel(perf_frame, text=f"{label}:")
-                label_widget.grid(row=i+1, column=0, padx=10, pady=5, sticky="w")
-                
-                value_widget = ctk.CTkLabel(perf_frame, text="0")
-                value_widget.grid(row=i+1, column=1, padx=10, pady=5, sticky="w")
-                
-                self.metrics_widgets[key] = value_widget
+            ), default_text="0")
             
             # Latency chart
-            if matplotlib_available:
-                chart_frame = ctk.CTkFrame(perf_frame)
-                chart_frame.grid(row=10, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
-                
-                self.charts["latency"] = MetricsChart(chart_frame, "Latency (ms)", "Milliseconds")
-                self.charts["latency"].get_widget().pack(fill="both", expand=True)
+            self._add_chart(perf_frame, "latency", "Latency (ms)", "Milliseconds")
             
         except Exception as e:
             self.logger.error(f"Error creating performance section: {e}")
@@ -226,36 +434,13 @@ class Dashboard:
     def _create_security_section(self) -> None:
         """Create security metrics section."""
         try:
-            # Security Frame
-            security_frame = ctk.CTkFrame(self.dashboard_frame)
-            security_frame.grid(row=2, column=0, padx=10, pady=10, sticky="nsew")
-            security_frame.grid_columnconfigure(1, weight=1)
-            
-            # Section title
-            title = ctk.CTkLabel(
-                security_frame,
-                text="🛡️ Security Status",
-                font=ctk.CTkFont(size=18, weight="bold")
-            )
-            title.grid(row=0, column=0, columnspan=2, pady=10)
-            
-            # Security metrics
-            security_items = [
+            self._build_kv_section(2, 0, "🛡️ Security Status", (
                 ("Security Level", "security_level"),
                 ("Detection Risk", "detection_risk"),
                 ("Randomizations", "randomizations"),
                 ("Stealth Operations", "stealth_ops"),
                 ("Suspicious Processes", "suspicious_procs"),
-            ]
-            
-            for i, (label, key) in enumerate(security_items):
-                label_widget = ctk.CTkLabel(security_frame, text=f"{label}:")
-                label_widget.grid(row=i+1, column=0, padx=10, pady=5, sticky="w")
-                
-                value_widget = ctk.CTkLabel(security_frame, text="Unknown")
-                value_widget.grid(row=i+1, column=1, padx=10, pady=5, sticky="w")
-                
-                self.metrics_widgets[key] = value_widget
+            ))
             
         except Exception as e:
             self.logger.error(f"Error creating security section: {e}")
@@ -263,226 +448,313 @@ class Dashboard:
     def _create_ai_section(self) -> None:
         """Create AI metrics section."""
         try:
-            # AI Frame
-            ai_frame = ctk.CTkFrame(self.dashboard_frame)
-            ai_frame.grid(row=2, column=1, padx=10, pady=10, sticky="nsew")
-            ai_frame.grid_columnconfigure(1, weight=1)
-            
-            # Section title
-            title = ctk.CTkLabel(
-                ai_frame,
-                text="🤖 AI Pattern Recognition",
-                font=ctk.CTkFont(size=18, weight="bold")
-            )
-            title.grid(row=0, column=0, columnspan=2, pady=10)
-            
-            # AI metrics
-            ai_items = [
+            ai_frame = self._build_kv_section(2, 1, "🤖 AI Pattern Recognition", (
                 ("Patterns Learned", "patterns_learned"),
                 ("Shots Recorded", "shots_recorded"),
                 ("Pattern Confidence", "pattern_confidence"),
                 ("Learning Enabled", "learning_enabled"),
                 ("Model Trained", "model_trained"),
-            ]
-            
-            for i, (label, key) in enumerate(ai_items):
-                label_widget = ctk.CTkLabel(ai_frame, text=f"{label}:")
-                label_widget.grid(row=i+1, column=0, padx=10, pady=5, sticky="w")
-                
-                value_widget = ctk.CTkLabel(ai_frame, text="Unknown")
-                value_widget.grid(row=i+1, column=1, padx=10, pady=5, sticky="w")
-                
-                self.metrics_widgets[key] = value_widget
+            ))
             
             # Confidence chart
-            if matplotlib_available:
-                chart_frame = ctk.CTkFrame(ai_frame)
-                chart_frame.grid(row=10, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
-                
-                self.charts["confidence"] = MetricsChart(chart_frame, "Pattern Confidence", "Confidence")
-                self.charts["confidence"].get_widget().pack(fill="both", expand=True)
+            self._add_chart(ai_frame, "confidence", "Pattern Confidence", "Confidence")
             
         except Exception as e:
             self.logger.error(f"Error creating AI section: {e}")
     
+    def _build_kv_section(self, row: int, column: int, title: str, items: tuple,
+                          default_text: str = "Unknown"):
+        """Create a titled section frame with one label/value row per item."""
+        frame = ctk.CTkFrame(self.dashboard_frame)
+        frame.grid(row=row, column=column, padx=10, pady=10, sticky="nsew")
+        frame.grid_columnconfigure(1, weight=1)
+        
+        ctk.CTkLabel(frame, text=title, font=self._header_font).grid(
+            row=0, column=0, columnspan=2, pady=10
+        )
+        
+        for i, (label, key) in enumerate(items, start=1):
+            ctk.CTkLabel(frame, text=f"{label}:").grid(row=i, column=0, padx=10, pady=5, sticky="w")
+            value_widget = ctk.CTkLabel(frame, text=default_text)
+            value_widget.grid(row=i, column=1, padx=10, pady=5, sticky="w")
+            setattr(self.labels, key, MetricLabel(value_widget))
+        return frame
+    
+    def _add_chart(self, frame, key: str, title: str, y_label: str) -> None:
+        """Add a metrics chart at the bottom of a section frame."""
+        if not matplotlib_available:
+            return
+        
+        chart_frame = ctk.CTkFrame(frame)
+        chart_frame.grid(row=10, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
+        
+        self.charts[key] = MetricsChart(chart_frame, title, y_label, backend=self.chart_backend)
+        self.charts[key].get_widget().pack(fill="both", expand=True)
+    
     def update_metrics(self) -> None:
+        """Schedule a dashboard refresh, coalescing rapid calls into one."""
+        if not self.visible or not self.engine or self._pending:
+            return
+        
+        self._pending = True
+        self.parent.after_idle(self._do_update)
+    
+    def _do_update(self) -> None:
         """Update all dashboard metrics."""
         try:
-            if not self.visible or not self.engine:
+            if not self.visible:
                 return
             
-            # Engine status metrics
-            self._update_engine_metrics()
-            
-            # Performance metrics
-            self._update_performance_metrics()
-            
-            # Security metrics
-            self._update_security_metrics()
-            
-            # AI metrics
-            self._update_ai_metrics()
+            now = time.monotonic()
+            self._charts_due = self._charts_requested
+            self._charts_requested = False
+            
+            snapshot = self._collect_snapshot()
+            
+            # A section that fails is logged once and skipped for a while,
+            # instead of logging the same error on every tick
+            disabled_until = self._section_disabled_until
+            for name, updater, data in (
+                ("engine", self._update_engine_metrics, self.engine),
+                ("performance", self._update_performance_metrics, snapshot['performance']),
+                ("security", self._update_security_metrics, snapshot['security']),
+                ("AI", self._update_ai_metrics, snapshot['ai']),
+            ):
+                if disabled_until.get(name, 0.0) > now:
+                    continue
+                try:
+                    updater(data)
+                except Exception as e:
+                    disabled_until[name] = now + self.section_retry_delay
+                    if self.logger.isEnabledFor(logging.ERROR):
+                        self.logger.error(
+                            f"Error updating {name} metrics: {e} "
+                            f"(retrying in {self.section_retry_delay:.0f}s)"
+                        )
+            
+            # Draw whatever the charts buffered during this refresh
+            for chart in self.charts.values():
+                chart.flush()
             
         except Exception as e:
             self.logger.error(f"Error updating metrics: {e}")
+        finally:
+            self._pending = False
+    
+    def _collect_snapshot(self) -> Dict[str, Any]:
+        """Query every engine metric group once, as one consistent snapshot."""
+        engine = self.engine
+        self._snapshot = {
+            'timestamp': time.time(),
+            'performance': engine.get_performance_metrics(),
+            'security': engine.security_manager.get_security_status(),
+            'ai': engine.pattern_ai.get_pattern_metrics(),
+        }
+        return self._snapshot
     
-    def _update_engine_metrics(self) -> None:
+    def _update_engine_metrics(self, engine) -> None:
         """Update engine status metrics."""
-        try:
-            # Engine state
-            state = self.engine.state.value.title()
-            self.metrics_widgets["engine_state"].configure(text=state)
-            
-            # Current game
-            current_game = self.engine.game_detector.get_current_game()
-            game_name = current_game.display_name if current_game else "Not Detected"
-            self.metrics_widgets["current_game"].configure(text=game_name)
-            
-            # Current weapon
-            weapon = getattr(self.engine, 'current_weapon', None) or "None"
-            self.metrics_widgets["current_weapon"].configure(text=weapon)
-            
-            # Auto detection
-            auto_detect = self.engine.game_detector.detection_enabled
-            self.metrics_widgets["auto_detection"].configure(text="Enabled" if auto_detect else "Disabled")
-            
-            # Stealth mode
-            stealth = self.engine.security_manager.settings.stealth_mode
-            self.metrics_widgets["stealth_mode"].configure(text="Enabled" if stealth else "Disabled")
-            
-        except Exception as e:
-            self.logger.error(f"Error updating engine metrics: {e}")
+        labels = self.labels
+        game_detector = engine.game_detector
+        
+        # Engine state
+        state = engine.state
+        if state is not self._cached_state:
+            self._cached_state = state
+            self._cached_state_text = state.value.title()
+            labels.engine_state.set_text(self._cached_state_text)
+        
+        # Current game
+        current_game = game_detector.get_current_game()
+        if current_game is not self._cached_game:
+            self._cached_game = current_game
+            self._cached_game_name = current_game.display_name if current_game else "Not Detected"
+            labels.current_game.set_text(self._cached_game_name)
+        
+        # Current weapon
+        weapon = engine.current_weapon or "None"
+        labels.current_weapon.set_text(weapon)
+        
+        # Auto detection
+        auto_detect = game_detector.detection_enabled
+        labels.auto_detection.set_text(self._ENABLED_DISABLED[bool(auto_detect)])
+        
+        # Stealth mode
+        stealth = engine.security_manager.settings.stealth_mode
+        labels.stealth_mode.set_text(self._ENABLED_DISABLED[bool(stealth)])
     
-    def _update_performance_metrics(self) -> None:
+    def _update_performance_metrics(self, metrics: Dict[str, Any]) -> None:
         """Update performance metrics."""
-        try:
-            metrics = self.engine.get_performance_metrics()
-            
-            # Average latency
-            latency = metrics.get('average_latency', 0) * 1000  # Convert to ms
-            self.metrics_widgets["avg_latency"].configure(text=f"{latency:.2f} ms")
-            
-            # Add to latency chart
-            if "latency" in self.charts:
-                self.charts["latency"].add_data_point(latency)
-            
-            # Shots fired
-            shots = metrics.get('shots_fired', 0)
-            self.metrics_widgets["shots_fired"].configure(text=str(shots))
-            
-            # Compensations applied
-            compensations = metrics.get('compensations_applied', 0)
-            self.metrics_widgets["compensations"].configure(text=str(compensations))
-            
-            # Shots per minute
-            spm = metrics.get('shots_per_minute', 0)
-            self.metrics_widgets["shots_per_minute"].configure(text=f"{spm:.1f}")
-            
-            # Uptime
-            uptime = metrics.get('uptime', 0)
-            uptime_str = f"{int(uptime // 60)}m {int(uptime % 60)}s"
-            self.metrics_widgets["uptime"].configure(text=uptime_str)
-            
-        except Exception as e:
-            self.logger.error(f"Error updating performance metrics: {e}")
+        labels = self.labels
+        
+        # Average latency
+        latency = metrics['average_latency'] * 1000  # Convert to ms
+        labels.avg_latency.set_number(latency, 100, "{:.2f} ms")
+        
+        # Add to latency chart
+        if self._charts_due and "latency" in self.charts:
+            self.charts["latency"].add_data_point(latency)
+        
+        # Shots fired
+        labels.shots_fired.set_count(metrics['shots_fired'])
+        
+        # Compensations applied
+        labels.compensations.set_count(metrics['compensations_applied'])
+        
+        # Shots per minute
+        labels.shots_per_minute.set_number(metrics['shots_per_minute'], 10, "{:.1f}")
+        
+        # Uptime
+        uptime = int(metrics['uptime'])
+        if labels.uptime.number != uptime:
+            labels.uptime.number = uptime
+            minutes, seconds = divmod(uptime, 60)
+            labels.uptime.set_text(f"{minutes}m {seconds}s")
     
-    def _update_security_metrics(self) -> None:
+    def _update_security_metrics(self, security_status: Dict[str, Any]) -> None:
         """Update security metrics."""
-        try:
-            security_status = self.engine.security_manager.get_security_status()
-            
-            # Security level
-            level = security_status.get('security_level', 'unknown').title()
-            self.metrics_widgets["security_level"].configure(text=level)
-            
-            # Detection risk
-            risk = security_status.get('detection_risk_score', 0) * 100
-            self.metrics_widgets["detection_risk"].configure(text=f"{risk:.1f}%")
-            
-            # Security metrics
-            metrics = security_status.get('metrics', {})
-            
-            randomizations = metrics.get('randomizations_applied', 0)
-            self.metrics_widgets["randomizations"].configure(text=str(randomizations))
-            
-            stealth_ops = metrics.get('stealth_operations', 0)
-            self.metrics_widgets["stealth_ops"].configure(text=str(stealth_ops))
-            
-            # Suspicious processes
-            suspicious = security_status.get('suspicious_processes', 0)
-            self.metrics_widgets["suspicious_procs"].configure(text=str(suspicious))
-            
-        except Exception as e:
-            self.logger.error(f"Error updating security metrics: {e}")
+        labels = self.labels
+        
+        # Security level
+        level = security_status.get('security_level', 'unknown').title()
+        labels.security_level.set_text(level)
+        
+        # Detection risk
+        risk = security_status.get('detection_risk_score', 0) * 100
+        labels.detection_risk.set_number(risk, 10, "{:.1f}%")
+        
+        # Security metrics
+        metrics = security_status.get('metrics', {})
+        
+        labels.randomizations.set_count(metrics.get('randomizations_applied', 0))
+        labels.stealth_ops.set_count(metrics.get('stealth_operations', 0))
+        
+        # Suspicious processes
+        labels.suspicious_procs.set_count(security_status.get('suspicious_processes', 0))
     
-    def _update_ai_metrics(self) -> None:
+    def _update_ai_metrics(self, ai_metrics: Dict[str, Any]) -> None:
         """Update AI metrics."""
-        try:
-            ai_metrics = self.engine.pattern_ai.get_pattern_metrics()
-            
-            # Patterns learned
-            patterns = ai_metrics.get('total_patterns_learned', 0)
-            self.metrics_widgets["patterns_learned"].configure(text=str(patterns))
-            
-            # Shots recorded
-            shots = ai_metrics.get('total_shots_recorded', 0)
-            self.metrics_widgets["shots_recorded"].configure(text=str(shots))
-            
-            # Pattern confidence
-            confidence = ai_metrics.get('average_pattern_confidence', 0) * 100
-            self.metrics_widgets["pattern_confidence"].configure(text=f"{confidence:.1f}%")
-            
-            # Add to confidence chart
-            if "confidence" in self.charts:
-                self.charts["confidence"].add_data_point(confidence)
-            
-            # Learning enabled
-            learning = ai_metrics.get('learning_enabled', False)
-            self.metrics_widgets["learning_enabled"].configure(text="Enabled" if learning else "Disabled")
-            
-            # Model trained
-            trained = ai_metrics.get('model_trained', False)
-            self.metrics_widgets["model_trained"].configure(text="Yes" if trained else "No")
-            
-        except Exception as e:
-            self.logger.error(f"Error updating AI metrics: {e}")
+        labels = self.labels
+        
+        # Patterns learned
+        labels.patterns_learned.set_count(ai_metrics.get('total_patterns_learned', 0))
+        
+        # Shots recorded
+        labels.shots_recorded.set_count(ai_metrics.get('total_shots_recorded', 0))
+        
+        # Pattern confidence
+        confidence = ai_metrics.get('average_pattern_confidence', 0) * 100
+        labels.pattern_confidence.set_number(confidence, 10, "{:.1f}%")
+        
+        # Add to confidence chart
+        if self._charts_due and "confidence" in self.charts:
+            self.charts["confidence"].add_data_point(confidence)
+        
+        # Learning enabled
+        learning = ai_metrics.get('learning_enabled', False)
+        labels.learning_enabled.set_text(self._ENABLED_DISABLED[bool(learning)])
+        
+        # Model trained
+        trained = ai_metrics.get('model_trained', False)
+        labels.model_trained.set_text(self._YES_NO[bool(trained)])
     
     def show(self) -> None:
-        """Show the dashboard."""
+        """Show the dashboard and start refreshing it."""
         if self.dashboard_frame:
             self.dashboard_frame.grid(row=0, column=0, sticky="nsew")
             self.visible = True
+            
+            if self._after_id is None:
+                # Charts restart so the time spent hidden does not show up as a gap
+                self.clear_charts()
+                self._tick()
     
     def hide(self) -> None:
-        """Hide the dashboard."""
+        """Hide the dashboard and stop refreshing it."""
         if self.dashboard_frame:
             self.dashboard_frame.grid_remove()
             self.visible = False
+            
+            if self._after_id is not None:
+                self.parent.after_cancel(self._after_id)
+                self._after_id = None
+    
+    def apply_theme(self) -> None:
+        """Recolor the charts' plain Tk widgets after an appearance mode change."""
+        for chart in self.charts.values():
+            try:
+                chart.apply_theme()
+            except Exception as e:
+                self.logger.error(f"Error applying chart theme: {e}")
+    
+    def close(self) -> None:
+        """Stop refreshing and release the charts' widgets and figures."""
+        self.hide()
+        for chart in self.charts.values():
+            try:
+                chart.close()
+            except Exception as e:
+                self.logger.error(f"Error closing chart: {e}")
+        self.charts = {}
+    
+    def _tick(self) -> None:
+        """Refresh timer callback."""
+        if self._tick_count % self.chart_every == 0:
+            self._charts_requested = True
+        self._tick_count += 1
+        self.update_metrics()
+        self._after_id = self.parent.after(self.update_interval, self._tick)
     
     def clear_charts(self) -> None:
         """Clear all chart data."""
         for chart in self.charts.values():
             chart.clear()
+        self._tick_count = 0
     
     def export_metrics(self, file_path: str) -> bool:
         """Export current metrics to file."""
         try:
-            # Collect all current metrics
+            # Reuse the dashboard's snapshot if it is recent enough
+            snapshot = self._snapshot
+            if snapshot is None or time.time() - snapshot['timestamp'] > self.snapshot_max_age:
+                snapshot = self._collect_snapshot()
+            
             metrics_data = {
-                'timestamp': time.time(),
-                'engine_metrics': self.engine.get_performance_metrics(),
-                'security_metrics': self.engine.security_manager.get_security_status(),
-                'ai_metrics': self.engine.pattern_ai.get_pattern_metrics(),
+                'timestamp': snapshot['timestamp'],
+                'engine_metrics': snapshot['performance'],
+                'security_metrics': snapshot['security'],
+                'ai_metrics': snapshot['ai'],
             }
             
-            # Save to file
-            import json
-            with open(file_path, 'w') as f:
-                json.dump(metrics_data, f, indent=2, default=str)
-            
-            self.logger.info(f"Metrics exported to {file_path}")
+            # Serialize and write on a worker thread so the UI keeps running
+            threading.Thread(
+                target=self._write_metrics_file,
+                args=(file_path, metrics_data),
+                name="MetricsExport",
+                daemon=True
+            ).start()
             return True
             
         except Exception as e:
             self.logger.error(f"Error exporting metrics: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def _write_metrics_file(self, file_path: str, metrics_data: Dict[str, Any]) -> None:
+        """Write exported metrics atomically (runs on a worker thread)."""
+        try:
+            if orjson:
+                data = orjson.dumps(
+                    metrics_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+                )
+            else:
+                data = json.dumps(metrics_data, indent=2, default=str).encode('utf-8')
+            
+            temp_path = file_path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, file_path)
+            
+            self.logger.info(f"Metrics exported to {file_path}")
+            
+        except Exception as e:
+            self.logger.error(f"Error exporting metrics: {e}")
\ No newline at end of file
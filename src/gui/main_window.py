@@ -5,8 +5,8 @@ Modern CustomTkinter interface with real-time dashboard and controls
 
 import logging
 import asyncio
-import threading
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox
 from typing import Dict, Any, Optional
 
@@ -19,6 +19,14 @@ except ImportError:
     Image = None
     ImageTk = None
 
+# Widget classes used throughout the window, bound once at import time
+if ctk:
+    CTk, CTkFrame, CTkLabel, CTkButton, CTkFont = (
+        ctk.CTk, ctk.CTkFrame, ctk.CTkLabel, ctk.CTkButton, ctk.CTkFont
+    )
+else:
+    CTk = CTkFrame = CTkLabel = CTkButton = CTkFont = None
+
 from src.gui.dashboard import Dashboard
 from src.gui.settings import SettingsPanel
 from src.gui.profiles import ProfilesPanel
@@ -38,6 +46,16 @@ class MainWindow:
     - Responsive layout design
     """
     
+    # Panel id -> attribute holding the panel once it has been created
+    _PANEL_ATTRS = {
+        'dashboard': 'dashboard',
+        'settings': 'settings_panel',
+        'profiles': 'profiles_panel',
+    }
+    
+    # Icon shown in front of show_message text, by message type
+    _MESSAGE_ICONS = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}
+    
     def __init__(self, engine, config_manager):
         self.engine = engine
         self.config_manager = config_manager
@@ -49,26 +67,64 @@ class MainWindow:
             raise ImportError("CustomTkinter required for GUI")
         
         # GUI components
-        self.root: Optional[ctk.CTk] = None
+        self.root: Optional[CTk] = None
         self.theme_manager: Optional[ThemeManager] = None
         self.dashboard: Optional[Dashboard] = None
         self.settings_panel: Optional[SettingsPanel] = None
         self.profiles_panel: Optional[ProfilesPanel] = None
         
         # Layout frames
-        self.main_frame: Optional[ctk.CTkFrame] = None
-        self.sidebar_frame: Optional[ctk.CTkFrame] = None
-        self.content_frame: Optional[ctk.CTkFrame] = None
+        self.main_frame: Optional[CTkFrame] = None
+        self.sidebar_frame: Optional[CTkFrame] = None
+        self.content_frame: Optional[CTkFrame] = None
         
         # Control widgets
-        self.status_label: Optional[ctk.CTkLabel] = None
-        self.toggle_button: Optional[ctk.CTkButton] = None
-        self.current_game_label: Optional[ctk.CTkLabel] = None
-        self.current_weapon_label: Optional[ctk.CTkLabel] = None
+        self.status_label: Optional[CTkLabel] = None
+        self.toggle_button: Optional[CTkButton] = None
+        self.current_game_label: Optional[CTkLabel] = None
+        self.current_weapon_label: Optional[CTkLabel] = None
         
         # State
         self.current_panel = "dashboard"
-        self.running = False
+        self._active_nav: Optional[int] = None  # Index into _nav
+        
+        # Status refresh: pushed by the engine through _status_dirty, plus a slow
+        # heartbeat for values that drift without an event (latency average)
+        self.status_interval = 5000  # Milliseconds
+        self._status_after_id = None
+        self._status_dirty = False
+        # Last text set on each status widget, so unchanged text is not re-sent to Tk
+        self._last_status: Dict[str, Any] = {}
+        
+        # Config keys the window reacts to; all other keys are ignored
+        self._config_handlers = {
+            'gui.theme': self._apply_theme,
+            'gui.always_on_top': self._apply_always_on_top,
+            'gui.window_size': self._apply_window_size,
+        }
+        # Keys whose handlers relayout or restyle the whole window; changes are
+        # coalesced and only the latest value is applied on the next idle tick
+        self._deferred_config_keys = frozenset({'gui.theme', 'gui.window_size'})
+        self._pending_config: Dict[str, Any] = {}
+        self._config_apply_id = None
+        
+        # Keyboard shortcut sequence -> Tcl command id
+        self._key_binding_ids: Dict[str, str] = {}
+        
+        # Asyncio loop driven from the Tk mainloop, so engine coroutines run
+        # on the GUI thread without a second event loop thread
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.config_manager.attach_loop(self.loop)
+        self.asyncio_max_interval = 50  # Milliseconds between pumps when idle
+        self.shutdown_timeout = 5.0  # Seconds to let pending tasks finish on exit
+        self._asyncio_after_id = None
+        
+        # Engine metrics are gathered on the loop's executor; the status bar only
+        # reads the latest snapshot
+        self.metrics_interval = 0.5  # Seconds
+        self._latest_metrics: Dict[str, Any] = {}
+        self._metrics_task: Optional[asyncio.Task] = None
         
         # Initialize GUI
         self._create_window()
@@ -86,12 +142,11 @@ class MainWindow:
             ctk.set_default_color_theme("blue")
             
             # Create main window
-            self.root = ctk.CTk()
+            self.root = CTk()
             self.root.title("Hassan Ultimate Anti-Recoil v7.0 - Professional Edition")
             
             # Window configuration
             window_size = self.config_manager.get('gui.window_size', [1200, 800])
-            self.root.geometry(f"{window_size[0]}x{window_size[1]}")
             self.root.minsize(800, 600)
             
             # Window icon (if available)
@@ -101,8 +156,8 @@ class MainWindow:
             except:
                 pass  # Icon not available
             
-            # Center window on screen
-            self.root.update_idletasks()
+            # Size and center the window in one geometry call; the screen size
+            # is known before the window is mapped
             x = (self.root.winfo_screenwidth() // 2) - (window_size[0] // 2)
             y = (self.root.winfo_screenheight() // 2) - (window_size[1] // 2)
             self.root.geometry(f"{window_size[0]}x{window_size[1]}+{x}+{y}")
@@ -125,17 +180,20 @@ class MainWindow:
             self.root.grid_rowconfigure(0, weight=1)
             
             # Create main frames
-            self.sidebar_frame = ctk.CTkFrame(self.root, width=200, corner_radius=0)
+            self.sidebar_frame = CTkFrame(self.root, width=200, corner_radius=0)
             self.sidebar_frame.grid(row=0, column=0, rowspan=2, sticky="nsew")
             self.sidebar_frame.grid_propagate(False)
             
-            self.content_frame = ctk.CTkFrame(self.root, corner_radius=0)
+            self.content_frame = CTkFrame(self.root, corner_radius=0)
             self.content_frame.grid(row=0, column=1, sticky="nsew", padx=10, pady=10)
             self.content_frame.grid_columnconfigure(0, weight=1)
             self.content_frame.grid_rowconfigure(1, weight=1)
+            # The window size is set explicitly, so panel size requests need not
+            # propagate to the root; switching panels then relayouts only this frame
+            self.content_frame.grid_propagate(False)
             
             # Status bar frame
-            self.status_frame = ctk.CTkFrame(self.root, height=40, corner_radius=0)
+            self.status_frame = CTkFrame(self.root, height=40, corner_radius=0)
             self.status_frame.grid(row=1, column=1, sticky="ew", padx=10, pady=(0, 10))
             self.status_frame.grid_columnconfigure(1, weight=1)
             
@@ -151,16 +209,29 @@ class MainWindow:
             # Initialize theme manager
             self.theme_manager = ThemeManager(self.config_manager)
             
+            # Fonts shared by the sidebar and status bar widgets
+            self._fonts = {
+                'title': CTkFont(size=16, weight="bold"),
+                'nav': CTkFont(size=14),
+                'heading': CTkFont(size=14, weight="bold"),
+                'button': CTkFont(size=12, weight="bold"),
+                'body': CTkFont(size=12),
+                'small': CTkFont(size=10),
+                'icon': CTkFont(size=16),
+            }
+            
             # Setup sidebar
             self._setup_sidebar()
             
             # Setup status bar
             self._setup_status_bar()
             
-            # Initialize panels
-            self.dashboard = Dashboard(self.content_frame, self.engine, self.config_manager)
-            self.settings_panel = SettingsPanel(self.content_frame, self.engine, self.config_manager)
-            self.profiles_panel = ProfilesPanel(self.content_frame, self.engine, self.config_manager)
+            # Panels are created the first time they are shown
+            self._panel_factories = {
+                'dashboard': Dashboard,
+                'settings': SettingsPanel,
+                'profiles': ProfilesPanel,
+            }
             
             # Show default panel
             self._show_panel("dashboard")
@@ -175,10 +246,10 @@ class MainWindow:
         """Setup the sidebar navigation."""
         try:
             # App title and version
-            title_label = ctk.CTkLabel(
+            title_label = CTkLabel(
                 self.sidebar_frame,
                 text="Hassan Ultimate\nAnti-Recoil v7.0",
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=self._fonts['title']
             )
             title_label.grid(row=0, column=0, padx=20, pady=(20, 30))
             
@@ -189,52 +260,56 @@ class MainWindow:
                 ("Settings", "settings", "⚙️"),
             ]
             
-            self.nav_buttons = {}
+            # (panel_id, button) pairs, and each panel's index into them
+            self._nav = []
+            self._nav_index: Dict[str, int] = {}
             
             for i, (text, panel_id, icon) in enumerate(nav_buttons):
-                btn = ctk.CTkButton(
+                btn = CTkButton(
                     self.sidebar_frame,
                     text=f"{icon} {text}",
-                    command=lambda p=panel_id: self._show_panel(p),
+                    command=partial(self._show_panel, panel_id),
+                    fg_color=("gray84", "gray16"),
                     height=40,
-                    font=ctk.CTkFont(size=14)
+                    font=self._fonts['nav']
                 )
                 btn.grid(row=i+1, column=0, padx=20, pady=5, sticky="ew")
-                self.nav_buttons[panel_id] = btn
+                self._nav_index[panel_id] = len(self._nav)
+                self._nav.append((panel_id, btn))
             
             # Engine control section
-            control_frame = ctk.CTkFrame(self.sidebar_frame)
+            control_frame = CTkFrame(self.sidebar_frame)
             control_frame.grid(row=10, column=0, padx=20, pady=20, sticky="ew")
             
-            control_label = ctk.CTkLabel(
+            control_label = CTkLabel(
                 control_frame,
                 text="Engine Control",
-                font=ctk.CTkFont(size=14, weight="bold")
+                font=self._fonts['heading']
             )
             control_label.grid(row=0, column=0, padx=10, pady=(10, 5))
             
             # Toggle button
-            self.toggle_button = ctk.CTkButton(
+            self.toggle_button = CTkButton(
                 control_frame,
                 text="🔴 Start Engine",
                 command=self._toggle_engine,
                 height=35,
-                font=ctk.CTkFont(size=12, weight="bold")
+                font=self._fonts['button']
             )
             self.toggle_button.grid(row=1, column=0, padx=10, pady=5, sticky="ew")
             
             # Current game/weapon display
-            self.current_game_label = ctk.CTkLabel(
+            self.current_game_label = CTkLabel(
                 control_frame,
                 text="Game: Not Detected",
-                font=ctk.CTkFont(size=10)
+                font=self._fonts['small']
             )
             self.current_game_label.grid(row=2, column=0, padx=10, pady=2)
             
-            self.current_weapon_label = ctk.CTkLabel(
+            self.current_weapon_label = CTkLabel(
                 control_frame,
                 text="Weapon: None",
-                font=ctk.CTkFont(size=10)
+                font=self._fonts['small']
             )
             self.current_weapon_label.grid(row=3, column=0, padx=10, pady=(2, 10))
             
@@ -248,26 +323,26 @@ class MainWindow:
         """Setup the status bar."""
         try:
             # Status indicator
-            self.status_indicator = ctk.CTkLabel(
+            self.status_indicator = CTkLabel(
                 self.status_frame,
                 text="🔴",
-                font=ctk.CTkFont(size=16)
+                font=self._fonts['icon']
             )
             self.status_indicator.grid(row=0, column=0, padx=10, pady=5)
             
             # Status text
-            self.status_label = ctk.CTkLabel(
+            self.status_label = CTkLabel(
                 self.status_frame,
                 text="Engine Stopped",
-                font=ctk.CTkFont(size=12)
+                font=self._fonts['body']
             )
             self.status_label.grid(row=0, column=1, padx=5, pady=5, sticky="w")
             
             # Performance metrics
-            self.perf_label = ctk.CTkLabel(
+            self.perf_label = CTkLabel(
                 self.status_frame,
                 text="Latency: N/A | Shots: 0",
-                font=ctk.CTkFont(size=10)
+                font=self._fonts['small']
             )
             self.perf_label.grid(row=0, column=2, padx=10, pady=5, sticky="e")
             
@@ -283,45 +358,63 @@ class MainWindow:
             # Configuration change callbacks
             self.config_manager.add_change_callback(self._on_config_change)
             
-            # Keyboard shortcuts
-            self.root.bind('<F1>', lambda e: self._toggle_engine())
-            self.root.bind('<F2>', lambda e: self._show_panel('profiles'))
-            self.root.bind('<F3>', lambda e: self._show_panel('settings'))
-            self.root.bind('<Control-q>', lambda e: self._on_window_close())
+            # Engine status changes
+            if self.engine:
+                self.engine.add_status_callback(self._on_engine_status_change)
+            
+            # Keyboard shortcuts; the Tcl command ids are kept so they can be released on close
+            shortcuts = {
+                '<F1>': self._toggle_engine,
+                '<F2>': partial(self._show_panel, 'profiles'),
+                '<F3>': partial(self._show_panel, 'settings'),
+                '<Control-q>': self._on_window_close,
+            }
+            self._key_binding_ids = {
+                sequence: self.root.bind(sequence, partial(self._key_handler, callback))
+                for sequence, callback in shortcuts.items()
+            }
             
             self.logger.debug("Event bindings setup complete")
             
         except Exception as e:
             self.logger.error(f"Error setting up bindings: {e}")
     
+    @staticmethod
+    def _key_handler(callback, event) -> None:
+        """Adapt a no-argument callback to a Tk event handler."""
+        callback()
+    
     def _show_panel(self, panel_id: str) -> None:
         """Show a specific panel."""
         try:
-            # Hide all panels
-            if self.dashboard:
-                self.dashboard.hide()
-            if self.settings_panel:
-                self.settings_panel.hide()
-            if self.profiles_panel:
-                self.profiles_panel.hide()
-            
-            # Show selected panel
-            if panel_id == "dashboard":
-                self.dashboard.show()
-            elif panel_id == "settings":
-                self.settings_panel.show()
-            elif panel_id == "profiles":
-                self.profiles_panel.show()
-            
-            # Update navigation button states
-            for btn_id, btn in self.nav_buttons.items():
-                if btn_id == panel_id:
-                    btn.configure(fg_color=("gray75", "gray25"))
-                else:
-                    btn.configure(fg_color=("gray84", "gray16"))
+            nav_index = self._nav_index[panel_id]
+            if nav_index == self._active_nav:
+                return
+            
+            attr = self._PANEL_ATTRS[panel_id]
+            
+            # Hide the panels created so far
+            for other_attr in self._PANEL_ATTRS.values():
+                panel = getattr(self, other_attr)
+                if panel:
+                    panel.hide()
+            
+            # Show selected panel, creating it on first use
+            panel = getattr(self, attr)
+            if panel is None:
+                panel = self._panel_factories[panel_id](self.content_frame, self.engine, self.config_manager)
+                setattr(self, attr, panel)
+            panel.show()
+            
+            # Update navigation button states; only the old and new active buttons change
+            if self._active_nav is not None:
+                self._nav[self._active_nav][1].configure(fg_color=("gray84", "gray16"))
+            self._nav[nav_index][1].configure(fg_color=("gray75", "gray25"))
+            self._active_nav = nav_index
             
             self.current_panel = panel_id
-            self.logger.debug(f"Switched to panel: {panel_id}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Switched to panel: %s", panel_id)
             
         except Exception as e:
             self.logger.error(f"Error showing panel {panel_id}: {e}")
@@ -334,74 +427,188 @@ class MainWindow:
             
             if self.engine.state.value == "active":
                 # Stop engine
-                asyncio.create_task(self.engine.stop())
-                self.toggle_button.configure(text="🔴 Start Engine")
-                self.status_label.configure(text="Engine Stopped")
-                self.status_indicator.configure(text="🔴")
+                self.loop.create_task(self.engine.stop())
+                self._set_status_text('toggle', self.toggle_button, "🔴 Start Engine")
+                self._set_status_text('status', self.status_label, "Engine Stopped")
+                self._set_status_text('indicator', self.status_indicator, "🔴")
             else:
                 # Start engine
-                asyncio.create_task(self.engine.start())
-                self.toggle_button.configure(text="🟢 Stop Engine")
-                self.status_label.configure(text="Engine Running")
-                self.status_indicator.configure(text="🟢")
+                self.loop.create_task(self.engine.start())
+                self._set_status_text('toggle', self.toggle_button, "🟢 Stop Engine")
+                self._set_status_text('status', self.status_label, "Engine Running")
+                self._set_status_text('indicator', self.status_indicator, "🟢")
             
         except Exception as e:
             self.logger.error(f"Error toggling engine: {e}")
-            messagebox.showerror("Error", f"Failed to toggle engine: {e}")
+            self.show_message("Error", f"Failed to toggle engine: {e}", "error")
     
     def _on_config_change(self, key: str, old_value: Any, new_value: Any) -> None:
         """Handle configuration changes."""
+        handler = self._config_handlers.get(key)
+        if handler is None:
+            return
+        
         try:
-            if key == 'gui.theme':
-                ctk.set_appearance_mode(new_value)
-            elif key == 'gui.always_on_top':
-                self.root.attributes('-topmost', new_value)
-            elif key == 'gui.window_size':
-                self.root.geometry(f"{new_value[0]}x{new_value[1]}")
+            if key in self._deferred_config_keys:
+                self._pending_config[key] = new_value
+                if self._config_apply_id is None:
+                    self._config_apply_id = self.root.after_idle(self._apply_pending_config)
+                return
+            
+            handler(new_value)
             
         except Exception as e:
             self.logger.error(f"Error handling config change: {e}")
     
+    def _apply_pending_config(self) -> None:
+        """Apply the latest value of each deferred config change once."""
+        self._config_apply_id = None
+        pending, self._pending_config = self._pending_config, {}
+        
+        for key, value in pending.items():
+            try:
+                self._config_handlers[key](value)
+            except Exception as e:
+                self.logger.error(f"Error applying config change {key}: {e}")
+    
+    def _apply_theme(self, theme: str) -> None:
+        """Apply the gui.theme setting."""
+        ctk.set_appearance_mode(theme)
+        
+        # Plain Tk/ttk widgets inside the panels are not recolored by CTk
+        for attr in self._PANEL_ATTRS.values():
+            panel = getattr(self, attr)
+            if panel is not None and hasattr(panel, 'apply_theme'):
+                panel.apply_theme()
+    
+    def _apply_always_on_top(self, enabled: bool) -> None:
+        """Apply the gui.always_on_top setting."""
+        self.root.attributes('-topmost', enabled)
+    
+    def _apply_window_size(self, size: list) -> None:
+        """Apply the gui.window_size setting."""
+        self.root.geometry(f"{size[0]}x{size[1]}")
+    
     def _update_status(self) -> None:
         """Update status displays."""
+        engine = self.engine
+        if not engine:
+            return
+        
         try:
-            if not self.engine:
-                return
-            
-            # Update game detection
-            current_game = self.engine.game_detector.get_current_game()
+            current_game = engine.game_detector.get_current_game()
+            weapon = engine.current_weapon
+        except AttributeError:
+            # Engine components are being torn down
+            return
+        
+        # Update game detection
+        if current_game is not self._last_status.get('game_obj'):
+            self._last_status['game_obj'] = current_game
             if current_game:
-                self.current_game_label.configure(text=f"Game: {current_game.display_name}")
+                self._set_status_text('game', self.current_game_label, f"Game: {current_game.display_name}")
             else:
-                self.current_game_label.configure(text="Game: Not Detected")
+                self._set_status_text('game', self.current_game_label, "Game: Not Detected")
+        
+        # Update weapon
+        if weapon != self._last_status.get('weapon_name'):
+            self._last_status['weapon_name'] = weapon
+            self._set_status_text('weapon', self.current_weapon_label, f"Weapon: {weapon or 'None'}")
+        
+        # Update performance metrics; text is only built when the shown values change
+        metrics = self._latest_metrics
+        latency = round(metrics.get('average_latency', 0) * 1000, 1)  # Convert to ms
+        shots = metrics.get('shots_fired', 0)
+        if (latency, shots) != self._last_status.get('perf_values'):
+            self._last_status['perf_values'] = (latency, shots)
+            self._set_status_text('perf', self.perf_label, f"Latency: {latency:.1f}ms | Shots: {shots}")
+    
+    def _set_status_text(self, key: str, widget, text: str) -> None:
+        """Configure a status widget only if its text changed."""
+        if self._last_status.get(key) != text:
+            widget.configure(text=text)
+            self._last_status[key] = text
+    
+    def _update_status_periodic(self) -> None:
+        """Schedule the next status update, then update status displays."""
+        self._status_after_id = self.root.after(self.status_interval, self._update_status_periodic)
+        self._update_status()
+    
+    async def _metrics_producer(self) -> None:
+        """Refresh _latest_metrics from a worker thread every metrics_interval."""
+        while self.engine:
+            try:
+                metrics = await self.loop.run_in_executor(None, self.engine.get_performance_metrics)
+                previous = self._latest_metrics
+                self._latest_metrics = metrics
+                if (metrics['average_latency'], metrics['shots_fired']) != (
+                    previous.get('average_latency'), previous.get('shots_fired')
+                ):
+                    self._status_dirty = True
+            except Exception as e:
+                self.logger.error(f"Error collecting performance metrics: {e}")
             
-            # Update weapon
-            if hasattr(self.engine, 'current_weapon') and self.engine.current_weapon:
-                self.current_weapon_label.configure(text=f"Weapon: {self.engine.current_weapon}")
-            else:
-                self.current_weapon_label.configure(text="Weapon: None")
+            await asyncio.sleep(self.metrics_interval)
+    
+    def _on_engine_status_change(self) -> None:
+        """Mark the status bar stale (may run on the engine thread, so no Tk calls)."""
+        self._status_dirty = True
+    
+    def _pump_asyncio(self) -> None:
+        """Run the asyncio callbacks that are ready, then schedule the next pass."""
+        if self.loop.is_running():
+            # Fired by the nested Tcl loop of a modal dialog opened from inside a
+            # loop callback; the loop resumes once that callback returns
+            delay = self.asyncio_max_interval
+        else:
+            self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+            delay = self._next_asyncio_delay()
+        
+        # A nested pass may already have rescheduled; keep a single pump chain
+        if self._asyncio_after_id is not None:
+            self.root.after_cancel(self._asyncio_after_id)
+        self._asyncio_after_id = self.root.after(delay, self._pump_asyncio)
+        
+        # Apply engine status changes on the GUI thread (after rescheduling, so an
+        # error here cannot stop the pump)
+        if self._status_dirty:
+            self._status_dirty = False
+            self._update_status()
+    
+    def _next_asyncio_delay(self) -> int:
+        """Milliseconds until the loop next has work, capped at asyncio_max_interval."""
+        loop = self.loop
+        
+        # BaseEventLoop keeps ready callbacks in _ready and timers in a heap in _scheduled
+        if getattr(loop, '_ready', None):
+            return 1
+        
+        scheduled = getattr(loop, '_scheduled', None)
+        if not scheduled:
+            return self.asyncio_max_interval
+        
+        delay_ms = int((scheduled[0].when() - loop.time()) * 1000)
+        return max(1, min(self.asyncio_max_interval, delay_ms))
+    
+    def _shutdown_asyncio(self) -> None:
+        """Let pending tasks finish, cancel stragglers and close the loop."""
+        try:
+            pending = asyncio.all_tasks(self.loop)
+            if pending:
+                _, still_pending = self.loop.run_until_complete(
+                    asyncio.wait(pending, timeout=self.shutdown_timeout)
+                )
+                for task in still_pending:
+                    task.cancel()
+                if still_pending:
+                    self.loop.run_until_complete(asyncio.gather(*still_pending, return_exceptions=True))
             
-            # Update performance metrics
-            metrics = self.engine.get_performance_metrics()
-            latency = metrics.get('average_latency', 0) * 1000  # Convert to ms
-            shots = metrics.get('shots_fired', 0)
-            self.perf_label.configure(text=f"Latency: {latency:.1f}ms | Shots: {shots}")
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
+            self.loop.close()
             
         except Exception as e:
-            self.logger.error(f"Error updating status: {e}")
-    
-    def _status_update_loop(self) -> None:
-        """Status update loop (runs in separate thread)."""
-        while self.running:
-            try:
-                # Update status on main thread
-                self.root.after(0, self._update_status)
-                
-                # Sleep for update interval
-                threading.Event().wait(1.0)  # Update every second
-                
-            except Exception as e:
-                self.logger.error(f"Error in status update loop: {e}")
+            self.logger.error(f"Error shutting down asyncio loop: {e}")
     
     def _on_window_close(self) -> None:
         """Handle window close event."""
@@ -410,19 +617,52 @@ class MainWindow:
             
             # Stop engine if running
             if self.engine and self.engine.state.value == "active":
-                asyncio.create_task(self.engine.stop())
-            
-            # Save configuration
-            if self.config_manager and self.config_manager.has_unsaved_changes():
-                asyncio.create_task(self.config_manager.save())
-            
-            # Stop GUI update loop
-            self.running = False
+                self.loop.create_task(self.engine.stop())
+            
+            # Save configuration, folding the delta log into the main file
+            if self.config_manager:
+                self.loop.create_task(self.config_manager.save(compact=True))
+            
+            # Stop metrics collection so shutdown does not wait on it
+            if self._metrics_task is not None:
+                self._metrics_task.cancel()
+                self._metrics_task = None
+            
+            # Stop status updates and asyncio pumping; remaining tasks are
+            # finished in _shutdown_asyncio once the mainloop has exited
+            if self._status_after_id is not None:
+                self.root.after_cancel(self._status_after_id)
+                self._status_after_id = None
+            if self._asyncio_after_id is not None:
+                self.root.after_cancel(self._asyncio_after_id)
+                self._asyncio_after_id = None
+            if self._config_apply_id is not None:
+                self.root.after_cancel(self._config_apply_id)
+                self._config_apply_id = None
+            
+            # Release keyboard shortcut commands so they do not keep the window alive
+            for sequence, func_id in self._key_binding_ids.items():
+                self.root.unbind(sequence, func_id)
+            self._key_binding_ids = {}
+            
+            # Detach from the config manager and engine, which outlive the window
+            if self.config_manager:
+                self.config_manager.remove_change_callback(self._on_config_change)
+                self.config_manager.stop_watching()
+            if self.engine:
+                self.engine.remove_status_callback(self._on_engine_status_change)
+            if self.dashboard:
+                self.dashboard.close()
             
             # Destroy window
             self.root.quit()
             self.root.destroy()
             
+            # Drop panel and engine references so they are freed without waiting for the GC;
+            # the stop task scheduled above keeps its own reference to the engine
+            self.dashboard = self.settings_panel = self.profiles_panel = None
+            self.engine = None
+            
         except Exception as e:
             self.logger.error(f"Error closing window: {e}")
     
@@ -431,10 +671,12 @@ class MainWindow:
         try:
             self.logger.info("Starting GUI application...")
             
-            # Start status update loop
-            self.running = True
-            status_thread = threading.Thread(target=self._status_update_loop, daemon=True)
-            status_thread.start()
+            # Start status updates on Tk's own timer
+            self._status_after_id = self.root.after(self.status_interval, self._update_status_periodic)
+            
+            # Drive the asyncio loop from inside the Tk mainloop
+            self._asyncio_after_id = self.root.after(0, self._pump_asyncio)
+            self._metrics_task = self.loop.create_task(self._metrics_producer())
             
             # Start main GUI loop
             self.root.mainloop()
@@ -443,30 +685,77 @@ class MainWindow:
             self.logger.error(f"Error running GUI: {e}")
             raise
         finally:
-            self.running = False
+            self._shutdown_asyncio()
     
     # Public API methods
     
-    def show_message(self, title: str, message: str, type: str = "info") -> None:
-        """Show a message dialog."""
+    def show_message(self, title: str, message: str, type: str = "info") -> asyncio.Future:
+        """
+        Show a non-modal message window.
+        
+        Unlike a messagebox this does not nest Tk's event loop, so engine
+        coroutines keep running while it is open. The returned future
+        resolves when the window is closed.
+        """
+        future = self.loop.create_future()
+        
+        def close() -> None:
+            dialog.destroy()
+            if not future.done():
+                future.set_result(None)
+        
+        try:
+            icon = self._MESSAGE_ICONS.get(type, self._MESSAGE_ICONS["info"])
+            dialog = ctk.CTkToplevel(self.root)
+            dialog.title(title)
+            dialog.transient(self.root)
+            dialog.protocol("WM_DELETE_WINDOW", close)
+            
+            CTkLabel(dialog, text=f"{icon} {message}", wraplength=360, justify="left").pack(
+                padx=20, pady=(20, 10)
+            )
+            CTkButton(dialog, text="OK", command=close).pack(pady=(0, 20))
+            
+        except Exception as e:
+            self.logger.error(f"Error showing message: {e}")
+            if not future.done():
+                future.set_result(None)
+        
+        return future
+    
+    def show_message_sync(self, title: str, message: str, type: str = "info") -> None:
+        """Show a modal message dialog and wait for it to be dismissed."""
         try:
             if type == "error":
-                messagebox.showerror(title, message)
+                self._run_modal(messagebox.showerror, title, message)
             elif type == "warning":
-                messagebox.showwarning(title, message)
+                self._run_modal(messagebox.showwarning, title, message)
             else:
-                messagebox.showinfo(title, message)
+                self._run_modal(messagebox.showinfo, title, message)
         except Exception as e:
             self.logger.error(f"Error showing message: {e}")
     
     def ask_confirmation(self, title: str, message: str) -> bool:
         """Ask for user confirmation."""
         try:
-            return messagebox.askyesno(title, message)
+            return self._run_modal(messagebox.askyesno, title, message)
         except Exception as e:
             self.logger.error(f"Error asking confirmation: {e}")
             return False
     
+    def _run_modal(self, dialog, *args) -> Any:
+        """
+        Run a blocking messagebox dialog.
+        
+        Opened from a Tk callback, the pump keeps running the asyncio loop
+        inside the dialog's nested event loop. Opened from a coroutine, the
+        loop is blocked until the dialog closes (the pump only keeps its
+        schedule), so coroutines should await show_message instead.
+        """
+        if self.loop.is_running():
+            self.logger.warning("Modal dialog opened from a coroutine; asyncio tasks wait until it closes")
+        return dialog(*args)
+    
     def get_current_panel(self) -> str:
         """Get currently active panel."""
         return self.current_panel
@@ -3,9 +3,11 @@ Profiles Panel for Hassan Ultimate Anti-Recoil
 Game and weapon profile management interface
 """
 
+import json
 import logging
-import tkinter as tk
-from typing import Dict, Any, Optional, List
+from pathlib import Path
+from tkinter import ttk
+from typing import Dict, Any, Optional, List, Tuple
 
 try:
     import customtkinter as ctk
@@ -25,6 +27,10 @@ class ProfilesPanel:
     - Real-time profile switching
     """
     
+    # ttk styles of the games and weapons lists, colored by apply_theme
+    TREE_STYLE = "Profiles.Treeview"
+    SCROLLBAR_STYLE = "Profiles.Vertical.TScrollbar"
+    
     def __init__(self, parent, engine, config_manager):
         self.parent = parent
         self.engine = engine
@@ -40,10 +46,20 @@ class ProfilesPanel:
         self.selected_weapon = None
         
         # Widgets
-        self.game_listbox = None
-        self.weapon_listbox = None
+        self.game_tree: Optional[ttk.Treeview] = None
+        self.weapon_tree: Optional[ttk.Treeview] = None
         self.profile_widgets = {}
         
+        # Game detector lookups, reused until the detector's definitions_version changes
+        self._supported_games_cache: Optional[Dict[str, Any]] = None
+        self._available_profiles_cache: Optional[Dict[str, Any]] = None
+        self._cache_version: Optional[int] = None
+        # definitions_version the games list was filled from
+        self._games_list_version: Optional[int] = None
+        
+        # Weapon profile file -> ((mtime_ns, size), parsed data); reused while the file is unchanged
+        self._profile_file_cache: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+        
         # Create profiles panel
         self._create_profiles_panel()
         
@@ -70,6 +86,8 @@ class ProfilesPanel:
             self._create_weapon_selection()
             self._create_profile_editor()
             
+            self.apply_theme()
+            
         except Exception as e:
             self.logger.error(f"Error creating profiles panel: {e}")
     
@@ -90,23 +108,13 @@ class ProfilesPanel:
             )
             title.grid(row=0, column=0, pady=10)
             
-            # Games list
-            games_list = ctk.CTkScrollableFrame(game_frame)
-            games_list.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
-            games_list.grid_columnconfigure(0, weight=1)
+            # Games list; a Treeview only draws the visible rows, unlike a
+            # scrollable frame holding one button per game
+            self.game_tree = self._create_tree(game_frame)
+            self.game_tree.bind("<<TreeviewSelect>>", self._on_game_tree_select)
             
             # Populate games
-            if self.engine and hasattr(self.engine, 'game_detector'):
-                supported_games = self.engine.game_detector.get_supported_games()
-                
-                for i, (game_id, game_info) in enumerate(supported_games.items()):
-                    game_btn = ctk.CTkButton(
-                        games_list,
-                        text=f"{game_info.display_name}",
-                        command=lambda g=game_id: self._select_game(g),
-                        height=40
-                    )
-                    game_btn.grid(row=i, column=0, padx=5, pady=2, sticky="ew")
+            self._populate_game_list()
             
             # Current game indicator
             self.current_game_label = ctk.CTkLabel(
@@ -137,17 +145,11 @@ class ProfilesPanel:
             title.grid(row=0, column=0, pady=10)
             
             # Weapons list
-            self.weapons_list = ctk.CTkScrollableFrame(weapon_frame)
-            self.weapons_list.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
-            self.weapons_list.grid_columnconfigure(0, weight=1)
+            self.weapon_tree = self._create_tree(weapon_frame)
+            self.weapon_tree.bind("<<TreeviewSelect>>", self._on_weapon_tree_select)
             
             # Will be populated when game is selected
-            no_game_label = ctk.CTkLabel(
-                self.weapons_list,
-                text="Select a game to view weapons",
-                font=ctk.CTkFont(size=12)
-            )
-            no_game_label.grid(row=0, column=0, pady=20)
+            self.weapon_tree.insert("", "end", text="Select a game to view weapons", tags=("placeholder",))
             
             # Current weapon indicator
             self.current_weapon_label = ctk.CTkLabel(
@@ -160,6 +162,115 @@ class ProfilesPanel:
         except Exception as e:
             self.logger.error(f"Error creating weapon selection: {e}")
     
+    def _populate_game_list(self) -> None:
+        """Fill the games list from the detector if its definitions changed since the last fill."""
+        if not (self.engine and hasattr(self.engine, 'game_detector')):
+            return
+        
+        supported_games = self._get_supported_games()
+        if self._games_list_version == self._cache_version:
+            return
+        
+        self.game_tree.delete(*self.game_tree.get_children())
+        for game_id, game_info in supported_games.items():
+            self.game_tree.insert("", "end", iid=game_id, text=game_info.display_name)
+        self._games_list_version = self._cache_version
+    
+    def _check_cache_version(self) -> None:
+        """Drop the cached lookups if the detector's definitions changed."""
+        version = getattr(self.engine.game_detector, 'definitions_version', 0)
+        if version != self._cache_version:
+            self.invalidate_caches()
+            self._cache_version = version
+    
+    def _get_supported_games(self) -> Dict[str, Any]:
+        """Get the supported games, cached until the detector's definitions change."""
+        self._check_cache_version()
+        if self._supported_games_cache is None:
+            self._supported_games_cache = self.engine.game_detector.get_supported_games()
+        return self._supported_games_cache
+    
+    def _get_available_profiles(self) -> Dict[str, Any]:
+        """Get the available game profiles, cached until the detector's definitions change."""
+        self._check_cache_version()
+        if self._available_profiles_cache is None:
+            self._available_profiles_cache = self.engine.game_detector.get_available_profiles()
+        return self._available_profiles_cache
+    
+    def invalidate_caches(self) -> None:
+        """Drop cached game and profile lookups so the next use re-reads them."""
+        self._supported_games_cache = None
+        self._available_profiles_cache = None
+        self._games_list_version = None
+    
+    def _create_tree(self, parent) -> ttk.Treeview:
+        """Create a single-selection list with a vertical scrollbar in grid row 1 of parent."""
+        container = ctk.CTkFrame(parent, fg_color="transparent")
+        container.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
+        container.grid_columnconfigure(0, weight=1)
+        container.grid_rowconfigure(0, weight=1)
+        
+        tree = ttk.Treeview(container, show="tree", selectmode="browse", style=self.TREE_STYLE)
+        tree.grid(row=0, column=0, sticky="nsew")
+        
+        scrollbar = ttk.Scrollbar(
+            container, orient="vertical", command=tree.yview, style=self.SCROLLBAR_STYLE
+        )
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        tree.configure(yscrollcommand=scrollbar.set)
+        
+        return tree
+    
+    def apply_theme(self) -> None:
+        """Color the ttk lists to match the section frames in the current appearance mode."""
+        try:
+            dark = ctk.get_appearance_mode() == "Dark"
+            
+            def pick(color):
+                # CTk colors are either one color or a (light, dark) pair
+                return color[dark] if isinstance(color, (tuple, list)) else color
+            
+            theme = ctk.ThemeManager.theme
+            background = pick(self.game_tree.master.master.cget("fg_color"))
+            foreground = pick(theme["CTkLabel"]["text_color"])
+            selected = pick(theme["CTkButton"]["fg_color"])
+            
+            style = ttk.Style(self.profiles_frame)
+            # Native themes (vista, aqua) ignore the color options below
+            if style.theme_use() not in ("clam", "alt", "default"):
+                style.theme_use("clam")
+            
+            style.configure(
+                self.TREE_STYLE, background=background, fieldbackground=background,
+                foreground=foreground, borderwidth=0, rowheight=30
+            )
+            style.map(
+                self.TREE_STYLE,
+                background=[("selected", selected)],
+                foreground=[("selected", pick(theme["CTkButton"]["text_color"]))]
+            )
+            style.configure(
+                self.SCROLLBAR_STYLE, background=pick(theme["CTkScrollbar"]["button_color"]),
+                troughcolor=background, bordercolor=background, arrowcolor=foreground
+            )
+            
+            self.weapon_tree.tag_configure("placeholder", foreground=pick(("gray50", "gray60")))
+            
+        except Exception as e:
+            self.logger.error(f"Error applying profiles theme: {e}")
+    
+    def _on_game_tree_select(self, event) -> None:
+        """Select the game highlighted in the games list."""
+        selection = self.game_tree.selection()
+        if selection:
+            self._select_game(selection[0])
+    
+    def _on_weapon_tree_select(self, event) -> None:
+        """Select the weapon highlighted in the weapons list."""
+        selection = self.weapon_tree.selection()
+        if selection and "placeholder" not in self.weapon_tree.item(selection[0], "tags"):
+            self._select_weapon(selection[0])
+    
     def _create_profile_editor(self) -> None:
         """Create profile editor section."""
         try:
@@ -272,7 +383,7 @@ class ProfilesPanel:
             
             # Update current game display
             if self.engine and hasattr(self.engine, 'game_detector'):
-                games = self.engine.game_detector.get_supported_games()
+                games = self._get_supported_games()
                 if game_id in games:
                     game_name = games[game_id].display_name
                     self.current_game_label.configure(text=f"Current: {game_name}")
@@ -293,36 +404,21 @@ class ProfilesPanel:
         """Load weapons for the selected game."""
         try:
             # Clear existing weapons
-            for widget in self.weapons_list.winfo_children():
-                widget.destroy()
+            self.weapon_tree.delete(*self.weapon_tree.get_children())
             
             # Get game profile to find weapons
             if self.engine and hasattr(self.engine, 'game_detector'):
-                profiles = self.engine.game_detector.get_available_profiles()
+                profiles = self._get_available_profiles()
                 
                 if game_id in profiles:
-                    profile = profiles[game_id]
-                    weapons = profile.weapon_list
-                    
-                    for i, weapon in enumerate(weapons):
-                        weapon_btn = ctk.CTkButton(
-                            self.weapons_list,
-                            text=weapon.replace('_', ' ').title(),
-                            command=lambda w=weapon: self._select_weapon(w),
-                            height=35
-                        )
-                        weapon_btn.grid(row=i, column=0, padx=5, pady=2, sticky="ew")
+                    weapons = profiles[game_id].weapon_list
                 else:
                     # Default weapons if no profile found
-                    default_weapons = ["assault_rifle", "submachine_gun", "sniper_rifle", "pistol"]
-                    for i, weapon in enumerate(default_weapons):
-                        weapon_btn = ctk.CTkButton(
-                            self.weapons_list,
-                            text=weapon.replace('_', ' ').title(),
-                            command=lambda w=weapon: self._select_weapon(w),
-                            height=35
-                        )
-                        weapon_btn.grid(row=i, column=0, padx=5, pady=2, sticky="ew")
+                    weapons = ["assault_rifle", "submachine_gun", "sniper_rifle", "pistol"]
+                
+                # Weapon names are the row ids, so duplicates are dropped
+                for weapon in dict.fromkeys(weapons):
+                    self.weapon_tree.insert("", "end", iid=weapon, text=weapon.replace('_', ' ').title())
             
         except Exception as e:
             self.logger.error(f"Error loading weapons for game: {e}")
@@ -411,9 +507,6 @@ class ProfilesPanel:
             }
             
             # Save to file (would normally save to database)
-            import json
-            from pathlib import Path
-            
             profiles_dir = Path("config/weapon_profiles")
             profiles_dir.mkdir(parents=True, exist_ok=True)
             
@@ -422,6 +515,9 @@ class ProfilesPanel:
             with open(profile_file, 'w') as f:
                 json.dump(profile_data, f, indent=2)
             
+            # Write through so the next load of this profile skips the disk
+            self._profile_file_cache[profile_file] = (self._file_signature(profile_file), profile_data)
+            
             self.logger.info(f"Profile saved: {profile_file}")
             
         except Exception as e:
@@ -433,16 +529,11 @@ class ProfilesPanel:
             if not self.selected_weapon:
                 return
             
-            from pathlib import Path
-            import json
-            
             profiles_dir = Path("config/weapon_profiles")
             profile_file = profiles_dir / f"{self.selected_game}_{self.selected_weapon}.json"
             
-            if profile_file.exists():
-                with open(profile_file, 'r') as f:
-                    profile_data = json.load(f)
-                
+            profile_data = self._read_profile_file(profile_file)
+            if profile_data is not None:
                 # Update widgets
                 self.weapon_name_var.set(profile_data.get('weapon_name', ''))
                 self.sensitivity_var.set(profile_data.get('sensitivity_multiplier', 1.0))
@@ -464,6 +555,29 @@ class ProfilesPanel:
         except Exception as e:
             self.logger.error(f"Error loading profile: {e}")
     
+    def _read_profile_file(self, profile_file: Path) -> Optional[dict]:
+        """Read a weapon profile file, reusing the parsed data while its mtime and size are unchanged."""
+        try:
+            signature = self._file_signature(profile_file)
+        except FileNotFoundError:
+            self._profile_file_cache.pop(profile_file, None)
+            return None
+        
+        cached = self._profile_file_cache.get(profile_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        with open(profile_file, 'r') as f:
+            profile_data = json.load(f)
+        self._profile_file_cache[profile_file] = (signature, profile_data)
+        return profile_data
+    
+    @staticmethod
+    def _file_signature(path: Path) -> Tuple[int, int]:
+        """Nanosecond mtime and size; size catches rewrites within the mtime granularity."""
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_size)
+    
     def _test_pattern(self) -> None:
         """Test the current recoil pattern."""
         try:
@@ -523,6 +637,7 @@ class ProfilesPanel:
         if self.profiles_frame:
             self.profiles_frame.grid(row=0, column=0, sticky="nsew")
             self.visible = True
+            self._populate_game_list()
             self._update_current_status()
     
     def hide(self) -> None: